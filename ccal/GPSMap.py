@@ -1,7 +1,6 @@
-from numpy import diag, full, issubdtype, linspace, mean, nan, number
+from numpy import diag, fill_diagonal, full, issubdtype, linspace, mean, nan, number
 from pandas import DataFrame, Series
 from scipy.spatial import Delaunay
-from scipy.spatial.distance import pdist, squareform
 
 from ._anneal_node_and_element_positions import _anneal_node_and_element_positions
 from ._check_node_x_element import _check_node_x_element
@@ -11,7 +10,9 @@ from ._make_grid_values_and_categorical_labels import (
     _make_grid_values_and_categorical_labels,
 )
 from ._plot_gps_map import _plot_gps_map
-from .apply_function_on_2_2d_arrays_slices import apply_function_on_2_2d_arrays_slices
+from .apply_function_on_2_2d_arrays_slices_in_tiles import (
+    apply_function_on_2_2d_arrays_slices_in_tiles,
+)
 from .COLOR_CATEGORICAL import COLOR_CATEGORICAL
 from .compute_information_distance import compute_information_distance
 from .mds import mds
@@ -39,12 +40,15 @@ class GPSMap:
         h_n_pull=None,
         h_pull_power=None,
         plot=True,
+        n_job=1,
     ):
 
         self.w = None
 
         self.h = None
 
+        self.n_job = n_job
+
         self.nodes = None
 
         self.node_name = None
@@ -163,10 +167,12 @@ class GPSMap:
                     yaxis_title=self.node_name,
                 )
 
-            self.w_distance__node_x_node = squareform(
-                pdist(self.w, metric=compute_information_distance)
+            self.w_distance__node_x_node = apply_function_on_2_2d_arrays_slices_in_tiles(
+                self.w, None, compute_information_distance, 1, n_job=self.n_job
             )
 
+            fill_diagonal(self.w_distance__node_x_node, 0)
+
             if plot:
 
                 plot_heat_map(
@@ -201,10 +207,12 @@ class GPSMap:
                     yaxis_title=self.node_name,
                 )
 
-            self.h_distance__node_x_node = squareform(
-                pdist(self.h, metric=compute_information_distance)
+            self.h_distance__node_x_node = apply_function_on_2_2d_arrays_slices_in_tiles(
+                self.h, None, compute_information_distance, 1, n_job=self.n_job
             )
 
+            fill_diagonal(self.h_distance__node_x_node, 0)
+
             if plot:
 
                 plot_heat_map(
@@ -649,26 +657,30 @@ class GPSMap:
 
             if self.w_distance__element_x_element is None:
 
-                self.w_distance__element_x_element = squareform(
-                    pdist(self.w.T, metric=compute_information_distance)
+                self.w_distance__element_x_element = apply_function_on_2_2d_arrays_slices_in_tiles(
+                    self.w, None, compute_information_distance, 0, n_job=self.n_job
                 )
 
+                fill_diagonal(self.w_distance__element_x_element, 0)
+
             distance__element_x_element = self.w_distance__element_x_element
 
             if self.w_distance__node_x_element is None:
 
-                distance__w_ielement_x_node = apply_function_on_2_2d_arrays_slices(
+                distance__w_ielement_x_node = apply_function_on_2_2d_arrays_slices_in_tiles(
                     self.w,
                     diag((1,) * len(self.nodes)),
                     compute_information_distance,
                     0,
+                    n_job=self.n_job,
                 )
 
-                distance__node_x_w_ielement = apply_function_on_2_2d_arrays_slices(
+                distance__node_x_w_ielement = apply_function_on_2_2d_arrays_slices_in_tiles(
                     self.w,
                     diag((1,) * len(self.w_elements)),
                     compute_information_distance,
                     1,
+                    n_job=self.n_job,
                 )
 
                 self.w_distance__node_x_element = (
@@ -683,26 +695,30 @@ class GPSMap:
 
             if self.h_distance__element_x_element is None:
 
-                self.h_distance__element_x_element = squareform(
-                    pdist(self.h.T, metric=compute_information_distance)
+                self.h_distance__element_x_element = apply_function_on_2_2d_arrays_slices_in_tiles(
+                    self.h, None, compute_information_distance, 0, n_job=self.n_job
                 )
 
+                fill_diagonal(self.h_distance__element_x_element, 0)
+
             distance__element_x_element = self.h_distance__element_x_element
 
             if self.h_distance__node_x_element is None:
 
-                distance__h_ielement_x_node = apply_function_on_2_2d_arrays_slices(
+                distance__h_ielement_x_node = apply_function_on_2_2d_arrays_slices_in_tiles(
                     self.h,
                     diag((1,) * len(self.nodes)),
                     compute_information_distance,
                     0,
+                    n_job=self.n_job,
                 )
 
-                distance__node_x_h_ielement = apply_function_on_2_2d_arrays_slices(
+                distance__node_x_h_ielement = apply_function_on_2_2d_arrays_slices_in_tiles(
                     self.h,
                     diag((1,) * len(self.h_elements)),
                     compute_information_distance,
                     1,
+                    n_job=self.n_job,
                 )
 
                 self.h_distance__node_x_element = (
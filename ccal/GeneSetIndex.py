@@ -0,0 +1,100 @@
+from numpy import (
+    arange,
+    argsort,
+    asarray,
+    bincount,
+    concatenate,
+    cumsum,
+    diff,
+    flatnonzero,
+    repeat,
+    savez_compressed,
+)
+from pandas import Index
+
+
+class GeneSetIndex:
+    def __init__(self, index, genes, gene_set_offsets, gene_ids):
+
+        self.index = Index(index, name="Gene Set")
+
+        self.genes = Index(genes, name="Gene")
+
+        self.gene_set_offsets = asarray(gene_set_offsets, dtype=int)
+
+        self.gene_ids = asarray(gene_ids, dtype=int)
+
+    @property
+    def shape(self):
+
+        return (self.index.size,)
+
+    def take(self, indices):
+
+        indices = asarray(indices, dtype=int)
+
+        starts = self.gene_set_offsets[indices]
+
+        sizes = diff(self.gene_set_offsets)[indices]
+
+        gene_set_offsets = concatenate(((0,), cumsum(sizes)))
+
+        return GeneSetIndex(
+            self.index[indices],
+            self.genes,
+            gene_set_offsets,
+            self.gene_ids[
+                repeat(starts - gene_set_offsets[:-1], sizes)
+                + arange(gene_set_offsets[-1])
+            ],
+        )
+
+    def select(self, gene_sets):
+
+        indices = self.index.get_indexer(gene_sets)
+
+        return self.take(indices[indices != -1])
+
+    def get_genes(self, gene_set):
+
+        i = self.index.get_loc(gene_set)
+
+        return self.genes[
+            self.gene_ids[self.gene_set_offsets[i] : self.gene_set_offsets[i + 1]]
+        ]
+
+    def get_gene_indices_and_offsets(self, genes):
+
+        gene_ids = self.genes.get_indexer(genes)
+
+        positions = flatnonzero(gene_ids != -1)
+
+        positions = positions[argsort(gene_ids[positions], kind="stable")]
+
+        n_positions = bincount(gene_ids[positions], minlength=self.genes.size)
+
+        sizes = n_positions[self.gene_ids]
+
+        gene_offsets = concatenate(((0,), cumsum(sizes)))
+
+        return (
+            positions[
+                repeat(
+                    concatenate(((0,), cumsum(n_positions)))[self.gene_ids]
+                    - gene_offsets[:-1],
+                    sizes,
+                )
+                + arange(gene_offsets[-1])
+            ],
+            gene_offsets[self.gene_set_offsets],
+        )
+
+    def write(self, npz_file_path):
+
+        savez_compressed(
+            npz_file_path,
+            index=self.index.values.astype(str),
+            genes=self.genes.values.astype(str),
+            gene_set_offsets=self.gene_set_offsets,
+            gene_ids=self.gene_ids,
+        )
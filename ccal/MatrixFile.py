@@ -0,0 +1,98 @@
+from numpy import asarray, load, unique
+from pandas import DataFrame, Index
+from tables import open_file
+
+
+class MatrixFile:
+    def __init__(
+        self, file_path, index=None, columns=None, node_path=None, column_indices=None
+    ):
+
+        self.file_path = file_path
+
+        self.node_path = node_path
+
+        self._column_indices = column_indices
+
+        if self.node_path is None:
+
+            self._shape = load(self.file_path, mmap_mode="r").shape
+
+        else:
+
+            with open_file(self.file_path, mode="r") as hdf5:
+
+                self._shape = hdf5.get_node(self.node_path).shape
+
+        if index is None:
+
+            index = Index(range(self._shape[0]))
+
+        self.index = index
+
+        if columns is None:
+
+            columns = Index(range(self._shape[1]))
+
+        self.columns = columns
+
+    @property
+    def shape(self):
+
+        if self._column_indices is None:
+
+            return self._shape
+
+        else:
+
+            return self._shape[0], len(self._column_indices)
+
+    def select_columns(self, column_indices):
+
+        columns = self.columns[column_indices]
+
+        if self._column_indices is not None:
+
+            column_indices = asarray(self._column_indices)[column_indices]
+
+        return MatrixFile(
+            self.file_path,
+            index=self.index,
+            columns=columns,
+            node_path=self.node_path,
+            column_indices=column_indices,
+        )
+
+    def read(self, rows):
+
+        if not isinstance(rows, slice):
+
+            rows, inverse_indices = unique(asarray(rows), return_inverse=True)
+
+        if self.node_path is None:
+
+            _2d_array = load(self.file_path, mmap_mode="r")[rows]
+
+        else:
+
+            with open_file(self.file_path, mode="r") as hdf5:
+
+                _2d_array = hdf5.get_node(self.node_path)[rows, :]
+
+        if not isinstance(rows, slice):
+
+            _2d_array = _2d_array[inverse_indices]
+
+        if self._column_indices is None:
+
+            return asarray(_2d_array)
+
+        else:
+
+            return asarray(_2d_array[:, self._column_indices])
+
+    def read_df(self, index):
+
+        return DataFrame(
+            self.read(self.index.get_indexer(index)), index=index, columns=self.columns
+        )
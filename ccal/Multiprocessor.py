@@ -0,0 +1,119 @@
+from multiprocessing.pool import Pool
+from os.path import isdir
+from shutil import disk_usage
+from tempfile import TemporaryDirectory
+
+from numpy.random import seed
+from pandas import DataFrame
+
+from ._call_and_time import _call_and_time
+from ._load_memory_mapped_arrays_and_call import _load_memory_mapped_arrays_and_call
+from ._memory_map_arrays import _memory_map_arrays
+
+
+class Multiprocessor:
+    def __init__(self, n_job, random_seed=20121020):
+
+        self.n_job = n_job
+
+        self.task_times = []
+
+        seed(random_seed)
+
+        self._pool = Pool(n_job)
+
+        self._id_memory_mapped = {}
+
+        self._temporary_directories = {}
+
+    def __enter__(self):
+
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+
+        self.close()
+
+    def close(self):
+
+        if self._pool is not None:
+
+            self._pool.terminate()
+
+            self._pool.join()
+
+            self._pool = None
+
+        for entry in tuple(self._id_memory_mapped.values()):
+
+            entry[4]()
+
+        for temporary_directory in self._temporary_directories.values():
+
+            temporary_directory.cleanup()
+
+        self._temporary_directories = {}
+
+    def _get_directory_path(self, n_byte):
+
+        if isdir("/dev/shm") and n_byte < disk_usage("/dev/shm").free:
+
+            parent_directory_path = "/dev/shm"
+
+        else:
+
+            parent_directory_path = None
+
+        if parent_directory_path not in self._temporary_directories:
+
+            self._temporary_directories[parent_directory_path] = TemporaryDirectory(
+                dir=parent_directory_path
+            )
+
+        return self._temporary_directories[parent_directory_path].name
+
+    def starmap(self, callable_, args, n_byte_to_memory_map=2 ** 20):
+
+        if n_byte_to_memory_map is None:
+
+            outputs_and_times = self._pool.starmap(
+                _call_and_time, ((callable_, args_) for args_ in args)
+            )
+
+        else:
+
+            checked_ids = set()
+
+            outputs_and_times = self._pool.starmap(
+                _call_and_time,
+                (
+                    (
+                        _load_memory_mapped_arrays_and_call,
+                        (
+                            callable_,
+                            _memory_map_arrays(
+                                args_,
+                                self._get_directory_path,
+                                n_byte_to_memory_map,
+                                self._id_memory_mapped,
+                                checked_ids,
+                            ),
+                        ),
+                    )
+                    for args_ in args
+                ),
+            )
+
+        self.task_times.extend(
+            (callable_.__name__, time) for output, time in outputs_and_times
+        )
+
+        return [output for output, time in outputs_and_times]
+
+    def summarize_task_times(self):
+
+        return (
+            DataFrame(self.task_times, columns=("Function", "Second"))
+            .groupby("Function")["Second"]
+            .agg(("size", "sum", "mean", "max"))
+        )
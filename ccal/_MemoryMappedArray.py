@@ -0,0 +1,24 @@
+from numpy import load
+from pandas import DataFrame
+
+
+class _MemoryMappedArray:
+    def __init__(self, npy_file_path, index=None, columns=None):
+
+        self._npy_file_path = npy_file_path
+
+        self._index = index
+
+        self._columns = columns
+
+    def load(self):
+
+        nd_array = load(self._npy_file_path, mmap_mode="c")
+
+        if self._index is None:
+
+            return nd_array
+
+        else:
+
+            return DataFrame(nd_array, index=self._index, columns=self._columns)
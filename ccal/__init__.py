@@ -11,32 +11,69 @@ from .COLOR_WHITE_BROWN import COLOR_WHITE_BROWN
 from .DATA_DIRECTORY_PATH import DATA_DIRECTORY_PATH
 from .FeatureHDF5 import FeatureHDF5
 from .GPSMap import GPSMap
+from .GeneSetIndex import GeneSetIndex
 from .Genome import Genome
+from .MatrixFile import MatrixFile
+from .Multiprocessor import Multiprocessor
 from .VARIANT_CLASSIFICATION_MUTSIG_EFFECT import VARIANT_CLASSIFICATION_MUTSIG_EFFECT
 from .VARIANT_EFFECTS import VARIANT_EFFECTS
 from .VCF_ANN_FIELDS import VCF_ANN_FIELDS
 from .VCF_COLUMNS import VCF_COLUMNS
 from .VariantHDF5 import VariantHDF5
+from ._MemoryMappedArray import _MemoryMappedArray
 from ._anneal_node_and_element_positions import _anneal_node_and_element_positions
+from ._apply_function_on_2_2d_arrays_slices_tile import (
+    _apply_function_on_2_2d_arrays_slices_tile,
+)
+from ._call_and_time import _call_and_time
 from ._check_fastq_gzs import _check_fastq_gzs
 from ._check_node_x_element import _check_node_x_element
 from ._check_w_or_h import _check_w_or_h
 from ._cluster_clustering_x_element_and_compute_ccc import (
     _cluster_clustering_x_element_and_compute_ccc,
 )
+from ._compute_bcv_bandwidths import _compute_bcv_bandwidths
+from ._compute_bcvs import _compute_bcvs
+from ._compute_benjamini_hochberg_fdrs import _compute_benjamini_hochberg_fdrs
 from ._compute_context_indices import _compute_context_indices
+from ._compute_empirical_p_values_and_fdrs_from_counts import (
+    _compute_empirical_p_values_and_fdrs_from_counts,
+)
+from ._compute_information_coefficient_permutation_invariants import (
+    _compute_information_coefficient_permutation_invariants,
+)
+from ._compute_information_coefficients import _compute_information_coefficients
+from ._compute_kde2ds import _compute_kde2ds
 from ._compute_norm import _compute_norm
+from ._compute_norm_by_trace_identity import _compute_norm_by_trace_identity
+from ._compute_sequential_empirical_p_values import (
+    _compute_sequential_empirical_p_values,
+)
+from ._compute_single_sample_gsea_scores import _compute_single_sample_gsea_scores
 from ._count import _count
+from ._count_random_values_less_equal_and_great_equal import (
+    _count_random_values_less_equal_and_great_equal,
+)
 from ._describe_vcf_df import _describe_vcf_df
+from ._estimate_kde2d_using_r import _estimate_kde2d_using_r
 from ._fit_skew_t_pdfs import _fit_skew_t_pdfs
 from ._get_coclustering_portion import _get_coclustering_portion
+from ._get_condensed_coclustering_distance import _get_condensed_coclustering_distance
+from ._get_gene_indices_and_gene_set_offsets import (
+    _get_gene_indices_and_gene_set_offsets,
+)
 from ._get_target_grid_indices import _get_target_grid_indices
 from ._get_triangulation_edges import _get_triangulation_edges
+from ._group_rows_by_good_pattern import _group_rows_by_good_pattern
 from ._gzip_compress import _gzip_compress
 from ._identify_what_to_count import _identify_what_to_count
 from ._ignore_bad_and_compute_euclidean_distance_between_2_1d_arrays import (
     _ignore_bad_and_compute_euclidean_distance_between_2_1d_arrays,
 )
+from ._ignore_bad_and_compute_euclidean_distances import (
+    _ignore_bad_and_compute_euclidean_distances,
+)
+from ._load_memory_mapped_arrays_and_call import _load_memory_mapped_arrays_and_call
 from ._make_annotations import _make_annotations
 from ._make_clean_vcf_df import _make_clean_vcf_df
 from ._make_context_matrix import _make_context_matrix
@@ -44,24 +81,46 @@ from ._make_element_x_dimension import _make_element_x_dimension
 from ._make_grid_values_and_categorical_labels import (
     _make_grid_values_and_categorical_labels,
 )
+from ._make_nmf_consensus_clusters import _make_nmf_consensus_clusters
 from ._make_variant_dict_consistent import _make_variant_dict_consistent
 from ._match import _match
 from ._match_randomly_sampled_target_and_data_to_compute_margin_of_errors import (
     _match_randomly_sampled_target_and_data_to_compute_margin_of_errors,
 )
+from ._match_sampled_target_and_data import _match_sampled_target_and_data
 from ._match_target_and_data import _match_target_and_data
+from ._match_target_and_data_by_row_block import _match_target_and_data_by_row_block
+from ._match_target_and_data_using_data_invariants import (
+    _match_target_and_data_using_data_invariants,
+)
+from ._memory_map_arrays import _memory_map_arrays
+from ._minimize_by_brent import _minimize_by_brent
+from ._nmf_by_multiplicative_update_with_restarts import (
+    _nmf_by_multiplicative_update_with_restarts,
+)
+from ._nmf_by_sklearn_with_restarts import _nmf_by_sklearn_with_restarts
+from ._nmf_with_restarts import _nmf_with_restarts
 from ._normalize_nd_array import _normalize_nd_array
+from ._permute_genes_and_compute_gsea_scores import (
+    _permute_genes_and_compute_gsea_scores,
+)
+from ._permute_phenotypes_and_compute_gsea_scores import (
+    _permute_phenotypes_and_compute_gsea_scores,
+)
 from ._permute_target_and_match_target_and_data import (
     _permute_target_and_match_target_and_data,
 )
 from ._plot_2d import _plot_2d
 from ._plot_gps_map import _plot_gps_map
 from ._plot_mountain import _plot_mountain
+from ._plot_nmf_consensus_clusters import _plot_nmf_consensus_clusters
 from ._print_and_run_command import _print_and_run_command
 from ._process_target_or_data_for_plotting import _process_target_or_data_for_plotting
+from ._read_data_rows_and_call import _read_data_rows_and_call
+from ._read_rows import _read_rows
 from ._single_sample_gseas import _single_sample_gseas
+from ._tile_rows_and_permutations import _tile_rows_and_permutations
 from ._update_H_by_multiplicative_update import _update_H_by_multiplicative_update
-from ._update_W_by_multiplicative_update import _update_W_by_multiplicative_update
 from .add_conda_to_path import add_conda_to_path
 from .align_fastq_gzs_using_bwa_mem import align_fastq_gzs_using_bwa_mem
 from .align_fastq_gzs_using_hisat2 import align_fastq_gzs_using_hisat2
@@ -71,6 +130,9 @@ from .annotate_vcf_gz_using_bcftools_annotate import (
 from .annotate_vcf_gz_using_snpeff import annotate_vcf_gz_using_snpeff
 from .apply_function_on_2_1d_arrays import apply_function_on_2_1d_arrays
 from .apply_function_on_2_2d_arrays_slices import apply_function_on_2_2d_arrays_slices
+from .apply_function_on_2_2d_arrays_slices_in_tiles import (
+    apply_function_on_2_2d_arrays_slices_in_tiles,
+)
 from .bgzip_and_tabix import bgzip_and_tabix
 from .cast_series_to_builtins import cast_series_to_builtins
 from .cast_str_to_builtins import cast_str_to_builtins
@@ -96,7 +158,11 @@ from .compute_mutational_signature_enrichment import (
     compute_mutational_signature_enrichment,
 )
 from .compute_nd_array_margin_of_error import compute_nd_array_margin_of_error
+from .compute_pearson_correlation import compute_pearson_correlation
 from .compute_posterior_probability import compute_posterior_probability
+from .compute_signal_to_noise_ratio import compute_signal_to_noise_ratio
+from .compute_spearman_correlation import compute_spearman_correlation
+from .compute_t_statistic import compute_t_statistic
 from .concatenate_vcf_gzs_using_bcftools_concat import (
     concatenate_vcf_gzs_using_bcftools_concat,
 )
@@ -210,6 +276,7 @@ from .make_volume_dict import make_volume_dict
 from .mark_duplicates_in_bam_using_picard_markduplicates import (
     mark_duplicates_in_bam_using_picard_markduplicates,
 )
+from .match_many import match_many
 from .mds import mds
 from .merge_dicts_with_callable import merge_dicts_with_callable
 from .mount_volume import mount_volume
@@ -240,6 +307,7 @@ from .process_feature_x_sample import process_feature_x_sample
 from .read_copynumber_gistic2 import read_copynumber_gistic2
 from .read_correlate_copynumber_vs_mrnaseq import read_correlate_copynumber_vs_mrnaseq
 from .read_gct import read_gct
+from .read_gene_set_index import read_gene_set_index
 from .read_gff3_gz import read_gff3_gz
 from .read_gmt import read_gmt
 from .read_gmts import read_gmts
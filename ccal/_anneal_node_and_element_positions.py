@@ -1,10 +1,9 @@
 from numpy import exp, full, nan
 from numpy.random import choice, normal, random_sample, seed
 from scipy.spatial import Delaunay
-from scipy.spatial.distance import euclidean, pdist, squareform
+from scipy.spatial.distance import cdist, pdist, squareform
 from scipy.stats import pearsonr
 
-from .apply_function_on_2_2d_arrays_slices import apply_function_on_2_2d_arrays_slices
 from .plot_points import plot_points
 
 
@@ -44,9 +43,7 @@ def _anneal_node_and_element_positions(
     )[0]
 
     node_x_element_score = pearsonr(
-        apply_function_on_2_2d_arrays_slices(
-            node_x_dimension, element_x_dimension, euclidean, 1
-        ).ravel(),
+        cdist(node_x_dimension, element_x_dimension).ravel(),
         target_distance__node_x_element,
     )[0]
 
@@ -109,9 +106,7 @@ def _anneal_node_and_element_positions(
         )[0]
 
         r__node_x_element_score = pearsonr(
-            apply_function_on_2_2d_arrays_slices(
-                r__node_x_dimension, r__element_x_dimension, euclidean, 1
-            ).ravel(),
+            cdist(r__node_x_dimension, r__element_x_dimension).ravel(),
             target_distance__node_x_element,
         )[0]
 
@@ -0,0 +1,40 @@
+from numpy import full, nan
+
+from ._match_target_and_data import _match_target_and_data
+
+
+def _apply_function_on_2_2d_arrays_slices_tile(
+    _2d_array_0,
+    _2d_array_1,
+    function,
+    invariants_0,
+    invariants_1,
+    n_required,
+    raise_for_n_less_than_required,
+):
+
+    _2d_array = full((_2d_array_0.shape[0], _2d_array_1.shape[0]), nan)
+
+    for i_1, _1d_array in enumerate(_2d_array_1):
+
+        if invariants_0 is None:
+
+            function_kwargs = None
+
+        else:
+
+            function_kwargs = {
+                **invariants_0,
+                **{key: value[i_1] for key, value in invariants_1.items()},
+            }
+
+        _2d_array[:, i_1] = _match_target_and_data(
+            _1d_array,
+            _2d_array_0,
+            function,
+            n_required,
+            raise_for_n_less_than_required,
+            match_function_kwargs=function_kwargs,
+        )
+
+    return _2d_array
@@ -0,0 +1,10 @@
+from time import perf_counter
+
+
+def _call_and_time(callable_, args):
+
+    start = perf_counter()
+
+    output = callable_(*args)
+
+    return output, perf_counter() - start
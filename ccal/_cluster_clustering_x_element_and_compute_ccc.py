@@ -1,20 +1,89 @@
+from numpy import arange, full, min_scalar_type, sort, zeros
+from numpy.random import default_rng
 from scipy.cluster.hierarchy import cophenet, fcluster, linkage
-from scipy.spatial.distance import squareform
 
 from ._get_coclustering_portion import _get_coclustering_portion
+from ._get_condensed_coclustering_distance import (
+    _get_condensed_coclustering_distance,
+)
 
 
 def _cluster_clustering_x_element_and_compute_ccc(
-    clustering_x_element, k, linkage_method
+    clustering_x_element,
+    k,
+    linkage_method,
+    n_landmark=None,
+    random_seed=20121020,
+    n_byte_per_block=2 ** 28,
 ):
 
-    clustering_distance = squareform(
-        1 - _get_coclustering_portion(clustering_x_element)
+    n_element = clustering_x_element.shape[1]
+
+    if n_landmark is None or n_element <= n_landmark:
+
+        landmarks = arange(n_element)
+
+    else:
+
+        landmarks = sort(
+            default_rng(random_seed).choice(n_element, size=n_landmark, replace=False)
+        )
+
+    # Co-clustering and co-sampling counts, a bool temporary, and the float64 portion
+    n_byte_per_block_element = (
+        2 * min_scalar_type(clustering_x_element.shape[0]).itemsize + 1 + 8
+    )
+
+    n_element_per_block = max(
+        1, n_byte_per_block // (max(1, landmarks.size) * n_byte_per_block_element)
+    )
+
+    print(
+        "Consensus clustering {} element ({} landmark) needs ~{:.2e} byte ...".format(
+            n_element,
+            landmarks.size,
+            landmarks.size * (landmarks.size - 1) // 2 * 8 * 3
+            + min(n_element_per_block, n_element)
+            * landmarks.size
+            * n_byte_per_block_element,
+        )
+    )
+
+    clustering_distance = _get_condensed_coclustering_distance(
+        clustering_x_element[:, landmarks], n_element_per_block
     )
 
     clustering_distance_linkage = linkage(clustering_distance, method=linkage_method)
 
-    return (
-        fcluster(clustering_distance_linkage, k, criterion="maxclust") - 1,
-        cophenet(clustering_distance_linkage, clustering_distance)[0],
+    landmark_clusters = (
+        fcluster(clustering_distance_linkage, k, criterion="maxclust") - 1
     )
+
+    ccc = cophenet(clustering_distance_linkage, clustering_distance)[0]
+
+    if landmarks.size == n_element:
+
+        return landmark_clusters, ccc
+
+    landmark_x_cluster = zeros((landmarks.size, landmark_clusters.max() + 1))
+
+    landmark_x_cluster[arange(landmarks.size), landmark_clusters] = 1
+
+    landmark_x_cluster /= landmark_x_cluster.sum(axis=0)
+
+    element_clusters = full(n_element, -1)
+
+    for start in range(0, n_element, n_element_per_block):
+
+        stop = min(start + n_element_per_block, n_element)
+
+        element_clusters[start:stop] = (
+            _get_coclustering_portion(
+                clustering_x_element[:, start:stop], clustering_x_element[:, landmarks]
+            )
+            @ landmark_x_cluster
+        ).argmax(axis=1)
+
+    element_clusters[landmarks] = landmark_clusters
+
+    return element_clusters, ccc
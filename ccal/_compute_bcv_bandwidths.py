@@ -0,0 +1,69 @@
+from math import ceil
+
+from numpy import (
+    absolute,
+    arange,
+    array_split,
+    bincount,
+    concatenate,
+    full,
+    rint,
+    sqrt,
+    trunc,
+)
+from numpy.fft import irfft, rfft
+
+from ._compute_bcvs import _compute_bcvs
+from ._minimize_by_brent import _minimize_by_brent
+
+
+def _compute_bcv_bandwidths(_2d_array, n_bin=1000, n_row_per_block=1024):
+
+    # Row-wise port of MASS::bcv (biased cross-validation on binned pairwise distances)
+
+    n_row, n = _2d_array.shape
+
+    if n < 2:
+
+        raise ValueError("Need at least 2 values.")
+
+    bandwidths = []
+
+    for _2d_array_ in array_split(_2d_array, max(1, ceil(n_row / n_row_per_block))):
+
+        n_row_ = _2d_array_.shape[0]
+
+        bandwidth_maxs = (
+            1.144 * sqrt(_2d_array_.var(axis=1, ddof=1)) * n ** (-1 / 5) * 4
+        )
+
+        bin_widths = (_2d_array_.max(axis=1) - _2d_array_.min(axis=1)) * 1.01 / n_bin
+
+        bin_indices = trunc(_2d_array_ / bin_widths[:, None]).astype(int)
+
+        bin_indices -= bin_indices.min(axis=1)[:, None]
+
+        n_row_bin = bin_indices.max() + 1
+
+        bin_counts = bincount(
+            (bin_indices + arange(n_row_)[:, None] * n_row_bin).ravel(),
+            minlength=n_row_ * n_row_bin,
+        ).reshape(n_row_, n_row_bin)
+
+        pair_counts = rint(
+            irfft(absolute(rfft(bin_counts, n_row_bin * 2)) ** 2, n_row_bin * 2)
+        )[:, : min(n_row_bin, n_bin)]
+
+        pair_counts[:, 0] = (pair_counts[:, 0] - n) / 2
+
+        bandwidths.append(
+            _minimize_by_brent(
+                _compute_bcvs,
+                0.1 * bandwidth_maxs,
+                bandwidth_maxs,
+                0.01 * bandwidth_maxs,
+                args=(full(n_row_, n), bin_widths, pair_counts),
+            )
+        )
+
+    return concatenate(bandwidths)
@@ -0,0 +1,16 @@
+from numpy import arange, exp, pi, sqrt, where
+
+
+def _compute_bcvs(bandwidths, ns, bin_widths, pair_counts):
+
+    bandwidths = bandwidths / 4
+
+    deltas = (arange(pair_counts.shape[1]) * (bin_widths / bandwidths)[:, None]) ** 2
+
+    terms = where(
+        deltas < 1000, exp(-deltas / 4) * (deltas ** 2 - 12 * deltas + 12), 0
+    )
+
+    return (1 + (terms * pair_counts).sum(axis=1) / (32 * ns)) / (
+        2 * ns * bandwidths * sqrt(pi)
+    )
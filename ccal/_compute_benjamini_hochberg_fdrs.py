@@ -0,0 +1,16 @@
+from numpy import arange, empty, minimum
+
+
+def _compute_benjamini_hochberg_fdrs(p_values):
+
+    sorting_indices = p_values.argsort()
+
+    sorted_fdrs = minimum.accumulate(
+        (p_values[sorting_indices] * p_values.size / arange(1, p_values.size + 1))[::-1]
+    )[::-1].clip(max=1)
+
+    fdrs = empty(p_values.size)
+
+    fdrs[sorting_indices] = sorted_fdrs
+
+    return fdrs
@@ -0,0 +1,43 @@
+from numpy import maximum, where
+
+from ._compute_benjamini_hochberg_fdrs import _compute_benjamini_hochberg_fdrs
+
+
+def _compute_empirical_p_values_and_fdrs_from_counts(
+    n_less_equal_random_values,
+    n_great_equal_random_values,
+    n_random_value,
+    p_value_direction,
+):
+
+    if p_value_direction in ("less_or_great", "less"):
+
+        p_values_less = maximum(1, n_less_equal_random_values) / n_random_value
+
+        fdrs_less = _compute_benjamini_hochberg_fdrs(p_values_less)
+
+    if p_value_direction in ("less_or_great", "great"):
+
+        p_values_great = maximum(1, n_great_equal_random_values) / n_random_value
+
+        fdrs_great = _compute_benjamini_hochberg_fdrs(p_values_great)
+
+    if p_value_direction == "less_or_great":
+
+        p_values = where(p_values_less < p_values_great, p_values_less, p_values_great)
+
+        fdrs = where(fdrs_less < fdrs_great, fdrs_less, fdrs_great)
+
+    elif p_value_direction == "less":
+
+        p_values = p_values_less
+
+        fdrs = fdrs_less
+
+    elif p_value_direction == "great":
+
+        p_values = p_values_great
+
+        fdrs = fdrs_great
+
+    return p_values, fdrs
@@ -0,0 +1,34 @@
+from numpy import full, nan
+
+from ._compute_bcv_bandwidths import _compute_bcv_bandwidths
+
+
+def _compute_information_coefficient_permutation_invariants(_2d_array, _1d_array):
+
+    invariants = {}
+
+    if _2d_array is not None:
+
+        bcv_bandwidths_0 = full(_2d_array.shape[0], nan)
+
+        is_not_constant = ~(_2d_array == _2d_array[:, :1]).all(axis=1)
+
+        if is_not_constant.any():
+
+            bcv_bandwidths_0[is_not_constant] = _compute_bcv_bandwidths(
+                _2d_array[is_not_constant]
+            )
+
+        invariants["x_bcv_bandwidth"] = bcv_bandwidths_0
+
+    if _1d_array is not None:
+
+        if (_1d_array == _1d_array[0]).all():
+
+            invariants["y_bcv_bandwidth"] = nan
+
+        else:
+
+            invariants["y_bcv_bandwidth"] = _compute_bcv_bandwidths(_1d_array[None])[0]
+
+    return invariants
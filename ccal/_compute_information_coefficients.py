@@ -0,0 +1,140 @@
+from math import ceil
+
+from numpy import (
+    absolute,
+    array_split,
+    asarray,
+    concatenate,
+    exp,
+    finfo,
+    full,
+    isnan,
+    log,
+    nan,
+    sign,
+    sqrt,
+)
+
+from ._compute_bcv_bandwidths import _compute_bcv_bandwidths
+from ._compute_kde2ds import _compute_kde2ds
+from ._estimate_kde2d_using_r import _estimate_kde2d_using_r
+from .compute_pearson_correlation import compute_pearson_correlation
+
+eps = finfo(float).eps
+
+
+def _compute_information_coefficients(
+    _2d_array,
+    _1d_array,
+    n_grid=24,
+    backend="numpy",
+    bcv_bandwidths_0=None,
+    bcv_bandwidth_1=None,
+    n_value_per_block=2 ** 23,
+):
+
+    information_coefficients = full(_2d_array.shape[0], nan)
+
+    pearson_correlations = compute_pearson_correlation(_2d_array, _1d_array)
+
+    is_valid = ~(
+        isnan(pearson_correlations)
+        | (_2d_array == _2d_array[:, :1]).all(axis=1)
+        | (_1d_array == _1d_array[0]).all()
+    )
+
+    if not is_valid.any():
+
+        return information_coefficients
+
+    _2d_array = _2d_array[is_valid]
+
+    pearson_correlations = pearson_correlations[is_valid]
+
+    bandwidth_factors = 1 - absolute(pearson_correlations) * 0.75
+
+    if backend == "numpy":
+
+        if bcv_bandwidths_0 is None:
+
+            bcv_bandwidths_0 = _compute_bcv_bandwidths(_2d_array)
+
+        else:
+
+            bcv_bandwidths_0 = bcv_bandwidths_0[is_valid]
+
+        if bcv_bandwidth_1 is None:
+
+            bcv_bandwidth_1 = _compute_bcv_bandwidths(_1d_array[None])[0]
+
+        bandwidths_0 = bcv_bandwidths_0 * bandwidth_factors
+
+        bandwidths_1 = bcv_bandwidth_1 * bandwidth_factors
+
+        n_block = ceil(_2d_array.size * n_grid / n_value_per_block)
+
+        fxys = (
+            concatenate(
+                tuple(
+                    _compute_kde2ds(
+                        _2d_array_, _1d_array, bandwidths_0_, bandwidths_1_, n_grid
+                    )
+                    for _2d_array_, bandwidths_0_, bandwidths_1_ in zip(
+                        array_split(_2d_array, n_block),
+                        array_split(bandwidths_0, n_block),
+                        array_split(bandwidths_1, n_block),
+                    )
+                )
+            )
+            + eps
+        )
+
+    elif backend == "r":
+
+        fxys = (
+            asarray(
+                tuple(
+                    _estimate_kde2d_using_r(
+                        _1d_array_, _1d_array, bandwidth_factor, n_grid
+                    )
+                    for _1d_array_, bandwidth_factor in zip(
+                        _2d_array, bandwidth_factors
+                    )
+                )
+            )
+            + eps
+        )
+
+    else:
+
+        raise ValueError("Unknown backend: {}.".format(backend))
+
+    dxs = ((_2d_array.max(axis=1) - _2d_array.min(axis=1)) / (n_grid - 1))[
+        :, None, None
+    ]
+
+    dy = (_1d_array.max() - _1d_array.min()) / (n_grid - 1)
+
+    pxys = fxys / (fxys.sum(axis=(1, 2))[:, None, None] * dxs * dy)
+
+    pxs = pxys.sum(axis=2) * dy
+
+    pys = pxys.sum(axis=1) * dxs[:, :, 0]
+
+    mis = (pxys * log(pxys / (pxs[:, :, None] * pys[:, None, :]))).sum(axis=(1, 2)) * (
+        dxs[:, 0, 0] * dy
+    )
+
+    # hxy = - (pxy * log(pxy)).sum() * dx * dy
+
+    # hx = -(px * log(px)).sum() * dx
+
+    # hy = -(py * log(py)).sum() * dy
+
+    # mi = hx + hy - hxy
+
+    information_coefficients[is_valid] = sign(pearson_correlations) * sqrt(
+        1 - exp(-2 * mis)
+    )
+
+    return information_coefficients
@@ -0,0 +1,26 @@
+from numpy import exp, linspace, pi, sqrt
+
+
+def _compute_kde2ds(_2d_array, _1d_array, bandwidths_0, bandwidths_1, n_grid):
+
+    # Row-wise port of MASS::kde2d on each row's and _1d_array's (min, max) grid
+
+    bandwidths_0 = bandwidths_0[:, None, None] / 4
+
+    bandwidths_1 = bandwidths_1[:, None, None] / 4
+
+    grids_0 = linspace(_2d_array.min(axis=1), _2d_array.max(axis=1), n_grid, axis=1)
+
+    grid_1 = linspace(_1d_array.min(), _1d_array.max(), n_grid)
+
+    kernels_0 = exp(
+        -(((grids_0[:, :, None] - _2d_array[:, None, :]) / bandwidths_0) ** 2) / 2
+    ) / sqrt(2 * pi)
+
+    kernels_1 = exp(-(((grid_1[:, None] - _1d_array) / bandwidths_1) ** 2) / 2) / sqrt(
+        2 * pi
+    )
+
+    return (kernels_0 @ kernels_1.transpose(0, 2, 1)) / (
+        _1d_array.size * bandwidths_0 * bandwidths_1
+    )
@@ -0,0 +1,12 @@
+from numpy import sqrt
+
+
+def _compute_norm_by_trace_identity(V_norm_squared, H, WtV, WtW, HHt):
+
+    return sqrt(
+        (
+            V_norm_squared
+            - 2 * (H * WtV).sum(axis=(-2, -1))
+            + (WtW * HHt).sum(axis=(-2, -1))
+        ).clip(min=0)
+    )
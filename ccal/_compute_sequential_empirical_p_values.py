@@ -0,0 +1,122 @@
+from numpy import flatnonzero, full, isfinite, maximum, minimum, nan, zeros
+
+from ._permute_target_and_match_target_and_data import (
+    _permute_target_and_match_target_and_data,
+)
+from ._read_data_rows_and_call import _read_data_rows_and_call
+from ._tile_rows_and_permutations import _tile_rows_and_permutations
+from .multiprocess import multiprocess
+
+
+def _compute_sequential_empirical_p_values(
+    target,
+    data,
+    scores,
+    n_job,
+    random_seed,
+    n_permutation,
+    n_exceedance_to_stop,
+    match_function,
+    n_required_for_match_function,
+    raise_for_n_less_than_required,
+    multiprocessor=None,
+    n_row_tile_min=1,
+):
+
+    print(
+        "Computing p-value with up to {} permutation (stopping at {} exceedance) ...".format(
+            n_permutation, n_exceedance_to_stop
+        )
+    )
+
+    n_less_equal_random_values = zeros(scores.size, dtype=int)
+
+    n_great_equal_random_values = zeros(scores.size, dtype=int)
+
+    n_random_values = zeros(scores.size, dtype=int)
+
+    n_permutations = zeros(scores.size, dtype=int)
+
+    is_permuting = isfinite(scores)
+
+    n_permutation_done = 0
+
+    n_permutation_to_do = max(1, n_exceedance_to_stop)
+
+    while is_permuting.any() and n_permutation_done < n_permutation:
+
+        n_permutation_to_do = min(
+            n_permutation_to_do, n_permutation - n_permutation_done
+        )
+
+        indices = flatnonzero(is_permuting)
+
+        tiles = _tile_rows_and_permutations(
+            indices.size, n_permutation_to_do, n_job, n_row_tile_min=n_row_tile_min
+        )
+
+        index_x_permutation = full((indices.size, n_permutation_to_do), nan)
+
+        for (rows, permutation_start, n_permutation_), output in zip(
+            tiles,
+            multiprocess(
+                _read_data_rows_and_call,
+                (
+                    (
+                        _permute_target_and_match_target_and_data,
+                        target,
+                        data,
+                        indices[rows],
+                        random_seed,
+                        n_permutation_,
+                        match_function,
+                        n_required_for_match_function,
+                        raise_for_n_less_than_required,
+                        n_permutation_done + permutation_start,
+                    )
+                    for rows, permutation_start, n_permutation_ in tiles
+                ),
+                n_job,
+                multiprocessor=multiprocessor,
+            ),
+        ):
+
+            index_x_permutation[
+                rows, permutation_start : permutation_start + n_permutation_
+            ] = output
+
+        scores_ = scores[indices][:, None]
+
+        n_less_equal_random_values[indices] += (index_x_permutation <= scores_).sum(
+            axis=1
+        )
+
+        n_great_equal_random_values[indices] += (scores_ <= index_x_permutation).sum(
+            axis=1
+        )
+
+        n_random_values[indices] += isfinite(index_x_permutation).sum(axis=1)
+
+        n_permutation_done += n_permutation_to_do
+
+        n_permutations[indices] = n_permutation_done
+
+        is_permuting[indices] = (
+            minimum(n_less_equal_random_values, n_great_equal_random_values)[indices]
+            < n_exceedance_to_stop
+        )
+
+        n_permutation_to_do *= 2
+
+    p_values = full(scores.size, nan)
+
+    is_good = isfinite(scores) & (0 < n_random_values)
+
+    p_values[is_good] = (
+        maximum(1, minimum(n_less_equal_random_values, n_great_equal_random_values))[
+            is_good
+        ]
+        / n_random_values[is_good]
+    )
+
+    return p_values, n_permutations
@@ -0,0 +1,145 @@
+from numpy import (
+    absolute,
+    arange,
+    argsort,
+    concatenate,
+    diff,
+    empty,
+    errstate,
+    full,
+    inf,
+    isfinite,
+    maximum,
+    minimum,
+    nan,
+    repeat,
+    take_along_axis,
+    where,
+    zeros,
+)
+
+
+def _compute_single_sample_gsea_scores(
+    gene_x_column, gene_indices, gene_set_offsets, statistic
+):
+
+    if statistic not in ("ks", "auc"):
+
+        raise ValueError("Unknown statistic: {}.".format(statistic))
+
+    n_gene, n_column = gene_x_column.shape
+
+    n_good = isfinite(gene_x_column).sum(axis=0)
+
+    ranks = empty(gene_x_column.shape, dtype=int)
+
+    ranks[argsort(-gene_x_column, axis=0, kind="stable"), arange(n_column)] = arange(
+        n_gene
+    )[:, None]
+
+    gene_set_indices = repeat(arange(gene_set_offsets.size - 1), diff(gene_set_offsets))
+
+    member_ranks = ranks[gene_indices]
+
+    indices = argsort(
+        gene_set_indices[:, None] * (n_gene + 1) + member_ranks, axis=0, kind="stable"
+    )
+
+    member_ranks = take_along_axis(member_ranks, indices, 0)
+
+    member_values = take_along_axis(gene_x_column[gene_indices], indices, 0)
+
+    is_hit = isfinite(member_values)
+
+    weights = where(is_hit, absolute(member_values), 0)
+
+    zeros_ = zeros((1, n_column))
+
+    hit_cumulative_sums = concatenate((zeros_, is_hit.cumsum(axis=0)))
+
+    weight_cumulative_sums = concatenate((zeros_, weights.cumsum(axis=0)))
+
+    n_hit = (
+        hit_cumulative_sums[gene_set_offsets[1:]]
+        - hit_cumulative_sums[gene_set_offsets[:-1]]
+    )
+
+    weight_sums = (
+        weight_cumulative_sums[gene_set_offsets[1:]]
+        - weight_cumulative_sums[gene_set_offsets[:-1]]
+    )
+
+    n_miss = n_good - n_hit
+
+    scores = full((gene_set_offsets.size - 1, n_column), nan)
+
+    is_not_empty = gene_set_offsets[:-1] < gene_set_offsets[1:]
+
+    with errstate(divide="ignore", invalid="ignore"):
+
+        if statistic == "ks" and is_not_empty.any():
+
+            member_weight_sums = weight_sums[gene_set_indices]
+
+            member_cumulative_weights = (
+                weight_cumulative_sums[1:]
+                - weight_cumulative_sums[gene_set_offsets[gene_set_indices]]
+            )
+
+            member_miss_cumulative_sums = (
+                member_ranks
+                - (arange(gene_indices.size) - gene_set_offsets[gene_set_indices])[
+                    :, None
+                ]
+            ) / n_miss[gene_set_indices]
+
+            after_hits = (
+                member_cumulative_weights / member_weight_sums
+                - member_miss_cumulative_sums
+            )
+
+            before_hits = (
+                member_cumulative_weights - weights
+            ) / member_weight_sums - member_miss_cumulative_sums
+
+            starts = gene_set_offsets[:-1][is_not_empty]
+
+            max_ = maximum(
+                maximum.reduceat(where(is_hit, after_hits, -inf), starts, axis=0), 0
+            )
+
+            min_ = minimum(
+                minimum.reduceat(
+                    where(is_hit & (0 < member_ranks), before_hits, inf),
+                    starts,
+                    axis=0,
+                ),
+                0,
+            )
+
+            scores[is_not_empty] = where(absolute(min_) < absolute(max_), max_, min_)
+
+        elif statistic == "auc":
+
+            member_n_after = where(is_hit, n_good - member_ranks, 0)
+
+            n_after_cumulative_sums = concatenate(
+                (zeros_, member_n_after.cumsum(axis=0))
+            )
+
+            weighted_n_after_cumulative_sums = concatenate(
+                (zeros_, (weights * member_n_after).cumsum(axis=0))
+            )
+
+            scores = (
+                weighted_n_after_cumulative_sums[gene_set_offsets[1:]]
+                - weighted_n_after_cumulative_sums[gene_set_offsets[:-1]]
+            ) / weight_sums - (
+                n_good * (n_good + 1) / 2
+                - n_after_cumulative_sums[gene_set_offsets[1:]]
+                + n_after_cumulative_sums[gene_set_offsets[:-1]]
+            ) / n_miss
+
+    scores[~(is_not_empty[:, None] & (0 < n_hit))] = nan
+
+    return scores
@@ -0,0 +1,13 @@
+from numpy import isfinite, searchsorted, sort
+
+
+def _count_random_values_less_equal_and_great_equal(values, random_values):
+
+    sorted_random_values = sort(random_values[isfinite(random_values)])
+
+    return (
+        searchsorted(sorted_random_values, values, side="right"),
+        sorted_random_values.size
+        - searchsorted(sorted_random_values, values, side="left"),
+        sorted_random_values.size,
+    )
@@ -0,0 +1,26 @@
+from numpy import asarray
+
+r_packages = {}
+
+
+def _estimate_kde2d_using_r(x, y, bandwidth_factor, n_grid):
+
+    import rpy2.robjects as ro
+    from rpy2.robjects.numpy2ri import numpy2ri
+    from rpy2.robjects.packages import importr
+
+    ro.conversion.py2ri = numpy2ri
+
+    if "MASS" not in r_packages:
+
+        r_packages["MASS"] = importr("MASS")
+
+    mass = r_packages["MASS"]
+
+    bandwidth_x = mass.bcv(x)[0] * bandwidth_factor
+
+    bandwidth_y = mass.bcv(y)[0] * bandwidth_factor
+
+    return asarray(
+        mass.kde2d(x, y, asarray((bandwidth_x, bandwidth_y)), n=asarray((n_grid,)))[2]
+    )
@@ -1,27 +1,114 @@
-from numpy import zeros
+from numpy import (
+    concatenate,
+    divide,
+    fill_diagonal,
+    isfinite,
+    min_scalar_type,
+    outer,
+    unique,
+    zeros,
+)
 
 
-def _get_coclustering_portion(clustering_x_element):
+def _get_coclustering_portion(
+    clustering_x_row_element, clustering_x_column_element=None
+):
 
-    n_coclustering__element_x_element = zeros((clustering_x_element.shape[1],) * 2)
+    if clustering_x_column_element is None:
 
-    for clustering in range(clustering_x_element.shape[0]):
+        clustering_x_column_element_ = clustering_x_row_element
 
-        for element_0 in range(clustering_x_element.shape[1]):
+    else:
 
-            for element_1 in range(element_0, clustering_x_element.shape[1]):
+        clustering_x_column_element_ = clustering_x_column_element
 
-                if element_0 == element_1:
+    n_clustering, n_row_element = clustering_x_row_element.shape
 
-                    n_coclustering__element_x_element[element_0, element_1] += 1
+    n_column_element = clustering_x_column_element_.shape[1]
 
-                elif (
-                    clustering_x_element[clustering, element_0]
-                    == clustering_x_element[clustering, element_1]
-                ):
+    dtype = min_scalar_type(n_clustering)
 
-                    n_coclustering__element_x_element[element_0, element_1] += 1
+    is_all_sampled = (
+        isfinite(clustering_x_row_element).all()
+        and isfinite(clustering_x_column_element_).all()
+    )
 
-                    n_coclustering__element_x_element[element_1, element_0] += 1
+    n_coclustering__row_element_x_column_element = zeros(
+        (n_row_element, n_column_element), dtype=dtype
+    )
 
-    return n_coclustering__element_x_element / clustering_x_element.shape[0]
+    if not is_all_sampled:
+
+        n_cosampling__row_element_x_column_element = zeros(
+            (n_row_element, n_column_element), dtype=dtype
+        )
+
+    for row_clusters, column_clusters in zip(
+        clustering_x_row_element, clustering_x_column_element_
+    ):
+
+        is_row_sampled = isfinite(row_clusters)
+
+        is_column_sampled = isfinite(column_clusters)
+
+        if not (is_row_sampled.any() and is_column_sampled.any()):
+
+            continue
+
+        cluster_indices = unique(
+            concatenate(
+                (row_clusters[is_row_sampled], column_clusters[is_column_sampled])
+            ),
+            return_inverse=True,
+        )[1].ravel()
+
+        n_cluster = cluster_indices.max() + 1
+
+        n_row_sampled = is_row_sampled.sum()
+
+        membership__row_element_x_cluster = zeros(
+            (n_row_element, n_cluster), dtype=bool
+        )
+
+        membership__row_element_x_cluster[
+            is_row_sampled, cluster_indices[:n_row_sampled]
+        ] = True
+
+        membership__column_element_x_cluster = zeros(
+            (n_column_element, n_cluster), dtype=bool
+        )
+
+        membership__column_element_x_cluster[
+            is_column_sampled, cluster_indices[n_row_sampled:]
+        ] = True
+
+        n_coclustering__row_element_x_column_element += (
+            membership__row_element_x_cluster @ membership__column_element_x_cluster.T
+        )
+
+        if not is_all_sampled:
+
+            n_cosampling__row_element_x_column_element += outer(
+                is_row_sampled, is_column_sampled
+            )
+
+    if is_all_sampled:
+
+        coclustering_portion__row_element_x_column_element = (
+            n_coclustering__row_element_x_column_element / n_clustering
+        )
+
+    else:
+
+        coclustering_portion__row_element_x_column_element = divide(
+            n_coclustering__row_element_x_column_element,
+            n_cosampling__row_element_x_column_element,
+            where=n_cosampling__row_element_x_column_element != 0,
+            out=zeros((n_row_element, n_column_element)),
+        )
+
+    if clustering_x_column_element is None:
+
+        fill_diagonal(coclustering_portion__row_element_x_column_element, 1)
+
+    return coclustering_portion__row_element_x_column_element
@@ -0,0 +1,38 @@
+from numpy import empty, subtract
+
+from ._get_coclustering_portion import _get_coclustering_portion
+
+
+def _get_condensed_coclustering_distance(clustering_x_element, n_element_per_block):
+
+    n_element = clustering_x_element.shape[1]
+
+    condensed_distance = empty(n_element * (n_element - 1) // 2)
+
+    offset = 0
+
+    for start in range(0, n_element - 1, n_element_per_block):
+
+        stop = min(start + n_element_per_block, n_element - 1)
+
+        distance__block_element_x_element = _get_coclustering_portion(
+            clustering_x_element[:, start:stop], clustering_x_element[:, start + 1 :]
+        )
+
+        subtract(
+            1,
+            distance__block_element_x_element,
+            out=distance__block_element_x_element,
+        )
+
+        for i in range(start, stop):
+
+            n_pair = n_element - 1 - i
+
+            condensed_distance[
+                offset : offset + n_pair
+            ] = distance__block_element_x_element[i - start, i - start :]
+
+            offset += n_pair
+
+    return condensed_distance
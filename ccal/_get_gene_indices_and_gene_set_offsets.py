@@ -0,0 +1,22 @@
+from numpy import asarray, concatenate, cumsum, flatnonzero
+
+from .GeneSetIndex import GeneSetIndex
+
+
+def _get_gene_indices_and_gene_set_offsets(gene_sets, genes):
+
+    if isinstance(gene_sets, GeneSetIndex):
+
+        return gene_sets.get_gene_indices_and_offsets(genes)
+
+    gene_indices = []
+
+    for gene_set_name, gene_set_genes in gene_sets.iterrows():
+
+        gene_indices.append(flatnonzero(genes.isin(gene_set_genes.dropna())))
+
+    gene_set_offsets = concatenate(
+        ((0,), cumsum([gene_indices_.size for gene_indices_ in gene_indices]))
+    ).astype(int)
+
+    return concatenate([asarray((), dtype=int)] + gene_indices), gene_set_offsets
@@ -0,0 +1,24 @@
+from warnings import warn
+
+from numpy import unique
+
+
+def _group_rows_by_good_pattern(is_good):
+
+    is_good_row = is_good.all(axis=1)
+
+    if is_good_row.all():
+
+        return is_good[:1], None
+
+    is_goods, group_indices = unique(is_good, axis=0, return_inverse=True)
+
+    warn(
+        "{} good & {} bad row ({} bad pattern).".format(
+            is_good_row.sum(),
+            is_good.shape[0] - is_good_row.sum(),
+            is_goods.shape[0] - is_good_row.any(),
+        )
+    )
+
+    return is_goods, group_indices.reshape(-1)
@@ -0,0 +1,25 @@
+from numpy import clip, isfinite, nanmean, sqrt, where
+from scipy.spatial.distance import pdist, squareform
+
+
+def _ignore_bad_and_compute_euclidean_distances(_2d_array):
+
+    is_good = isfinite(_2d_array)
+
+    if is_good.all():
+
+        return pdist(_2d_array)
+
+    is_good = is_good.astype(float)
+
+    _2d_array = where(is_good, _2d_array - nanmean(_2d_array, axis=0), 0)
+
+    _2d_array_squared = _2d_array ** 2
+
+    distances_squared = (
+        _2d_array_squared @ is_good.T
+        + is_good @ _2d_array_squared.T
+        - 2 * _2d_array @ _2d_array.T
+    )
+
+    return sqrt(clip(squareform(distances_squared, checks=False), 0, None))
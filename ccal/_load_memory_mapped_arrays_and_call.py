@@ -0,0 +1,8 @@
+from ._MemoryMappedArray import _MemoryMappedArray
+
+
+def _load_memory_mapped_arrays_and_call(callable_, args):
+
+    return callable_(
+        *(arg.load() if isinstance(arg, _MemoryMappedArray) else arg for arg in args)
+    )
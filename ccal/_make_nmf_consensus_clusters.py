@@ -0,0 +1,53 @@
+from numpy import concatenate
+from pandas import DataFrame, Index
+
+from ._cluster_clustering_x_element_and_compute_ccc import (
+    _cluster_clustering_x_element_and_compute_ccc,
+)
+
+
+def _make_nmf_consensus_clusters(
+    df, k, outputs, linkage_method, n_landmark, random_seed, directory_path
+):
+
+    w_0, h_0, _, _, R_norms = outputs[0]
+
+    e_0 = R_norms[0]
+
+    factors = Index(("F{}".format(i) for i in range(k)), name="Factor")
+
+    w_0 = DataFrame(w_0, index=df.index, columns=factors)
+
+    h_0 = DataFrame(h_0, index=factors, columns=df.columns)
+
+    if directory_path is not None:
+
+        w_0.to_csv("{}/w.tsv".format(directory_path), sep="\t")
+
+        h_0.to_csv("{}/h.tsv".format(directory_path), sep="\t")
+
+    w_element_cluster, w_element_cluster__ccc = _cluster_clustering_x_element_and_compute_ccc(
+        concatenate([output[2] for output in outputs]),
+        k,
+        linkage_method,
+        n_landmark=n_landmark,
+        random_seed=random_seed,
+    )
+
+    h_element_cluster, h_element_cluster__ccc = _cluster_clustering_x_element_and_compute_ccc(
+        concatenate([output[3] for output in outputs]),
+        k,
+        linkage_method,
+        n_landmark=n_landmark,
+        random_seed=random_seed,
+    )
+
+    return (
+        w_0,
+        h_0,
+        e_0,
+        w_element_cluster,
+        w_element_cluster__ccc,
+        h_element_cluster,
+        h_element_cluster__ccc,
+    )
@@ -1,14 +1,29 @@
-from numpy import array_split, concatenate
+from math import ceil
+
+from numpy import absolute, asarray, flatnonzero, full, isfinite, nan
 from pandas import DataFrame
 
+from ._compute_benjamini_hochberg_fdrs import _compute_benjamini_hochberg_fdrs
+from ._compute_empirical_p_values_and_fdrs_from_counts import (
+    _compute_empirical_p_values_and_fdrs_from_counts,
+)
+from ._compute_sequential_empirical_p_values import (
+    _compute_sequential_empirical_p_values,
+)
 from ._match_randomly_sampled_target_and_data_to_compute_margin_of_errors import (
     _match_randomly_sampled_target_and_data_to_compute_margin_of_errors,
 )
-from ._match_target_and_data import _match_target_and_data
+from ._match_target_and_data_by_row_block import (
+    _match_target_and_data_by_row_block,
+)
 from ._permute_target_and_match_target_and_data import (
     _permute_target_and_match_target_and_data,
 )
+from ._read_data_rows_and_call import _read_data_rows_and_call
+from ._read_rows import _read_rows
+from ._tile_rows_and_permutations import _tile_rows_and_permutations
 from .compute_empirical_p_values_and_fdrs import compute_empirical_p_values_and_fdrs
+from .compute_pearson_correlation import compute_pearson_correlation
 from .multiprocess import multiprocess
 from .select_series_indices import select_series_indices
 
@@ -25,38 +40,120 @@ def _match(
     random_seed,
     n_sampling,
     n_permutation,
+    count_permutation_scores=False,
+    n_exceedance_to_stop=None,
+    multiprocessor=None,
+    n_byte_per_row_block=2 ** 28,
+    n_screen=None,
+    screen_threshold=None,
+    screen_function=compute_pearson_correlation,
 ):
 
-    score_moe_p_value_fdr = DataFrame(columns=("Score", "0.95 MoE", "P-Value", "FDR"))
+    n_row_block = ceil(data.shape[0] * data.shape[1] * 8 / n_byte_per_row_block)
 
-    n_job = min(data.shape[0], n_job)
+    if n_screen is not None or screen_threshold is not None:
 
-    print(
-        "Computing score using {} with {} process ...".format(
-            match_function.__name__, n_job
+        screen_scores = _match_target_and_data_by_row_block(
+            target,
+            data,
+            n_job,
+            n_row_block,
+            screen_function,
+            n_required_for_match_function,
+            raise_for_n_less_than_required,
+            multiprocessor=multiprocessor,
         )
-    )
 
-    data_split = array_split(data, n_job)
+        is_promoted = isfinite(screen_scores)
 
-    score_moe_p_value_fdr["Score"] = concatenate(
-        multiprocess(
-            _match_target_and_data,
-            (
-                (
-                    target,
-                    data_,
-                    match_function,
-                    n_required_for_match_function,
-                    raise_for_n_less_than_required,
-                )
-                for data_ in data_split
-            ),
+        screen_scores_absolute = absolute(screen_scores)
+
+        if screen_threshold is not None:
+
+            is_promoted &= screen_threshold <= screen_scores_absolute
+
+        if n_screen is not None and n_screen < is_promoted.sum():
+
+            is_promoted[
+                flatnonzero(is_promoted)[
+                    screen_scores_absolute[is_promoted].argsort()[
+                        : is_promoted.sum() - n_screen
+                    ]
+                ]
+            ] = False
+
+        indices = flatnonzero(is_promoted)
+
+        print(
+            "Promoting {}/{} screened rows ...".format(indices.size, screen_scores.size)
+        )
+
+        if indices.size == 0:
+
+            columns = ["Score", "0.95 MoE", "P-Value", "FDR"]
+
+            if (
+                n_extreme is not None or fraction_extreme is not None
+            ) and n_exceedance_to_stop is not None:
+
+                columns.append("N Permutation")
+
+            score_moe_p_value_fdr = DataFrame(
+                index=range(screen_scores.size), columns=columns, dtype=float
+            )
+
+            score_moe_p_value_fdr["Score"] = screen_scores
+
+            score_moe_p_value_fdr["Promoted"] = is_promoted
+
+            return score_moe_p_value_fdr
+
+        promoted_score_moe_p_value_fdr = _match(
+            target,
+            _read_rows(data, indices),
             n_job,
+            match_function,
+            n_required_for_match_function,
+            raise_for_n_less_than_required,
+            n_extreme,
+            fraction_extreme,
+            random_seed,
+            n_sampling,
+            n_permutation,
+            count_permutation_scores=count_permutation_scores,
+            n_exceedance_to_stop=n_exceedance_to_stop,
+            multiprocessor=multiprocessor,
+            n_byte_per_row_block=n_byte_per_row_block,
         )
+
+        score_moe_p_value_fdr = DataFrame(
+            index=range(screen_scores.size),
+            columns=promoted_score_moe_p_value_fdr.columns,
+            dtype=float,
+        )
+
+        score_moe_p_value_fdr["Score"] = screen_scores
+
+        score_moe_p_value_fdr.iloc[indices] = promoted_score_moe_p_value_fdr.values
+
+        score_moe_p_value_fdr["Promoted"] = is_promoted
+
+        return score_moe_p_value_fdr
+
+    score_moe_p_value_fdr = DataFrame(columns=("Score", "0.95 MoE", "P-Value", "FDR"))
+
+    score_moe_p_value_fdr["Score"] = _match_target_and_data_by_row_block(
+        target,
+        data,
+        n_job,
+        n_row_block,
+        match_function,
+        n_required_for_match_function,
+        raise_for_n_less_than_required,
+        multiprocessor=multiprocessor,
     )
 
-    if n_extreme is None and fraction_extreme is None:
+    if n_extreme is not None or fraction_extreme is not None:
 
         indices = select_series_indices(
             score_moe_p_value_fdr["Score"],
@@ -70,36 +167,127 @@ def _match(
             indices, "0.95 MoE"
         ] = _match_randomly_sampled_target_and_data_to_compute_margin_of_errors(
             target,
-            data[indices],
+            _read_rows(data, asarray(indices)),
             random_seed,
             n_sampling,
             match_function,
             n_required_for_match_function,
             raise_for_n_less_than_required,
+            n_job=n_job,
+            multiprocessor=multiprocessor,
         )
 
-        score_moe_p_value_fdr[["P-Value", "FDR"]] = compute_empirical_p_values_and_fdrs(
-            score_moe_p_value_fdr["Score"],
-            concatenate(
-                multiprocess(
-                    _permute_target_and_match_target_and_data,
+        if n_exceedance_to_stop is not None:
+
+            p_values, n_permutations = _compute_sequential_empirical_p_values(
+                target,
+                data,
+                score_moe_p_value_fdr["Score"].values,
+                n_job,
+                random_seed,
+                n_permutation,
+                n_exceedance_to_stop,
+                match_function,
+                n_required_for_match_function,
+                raise_for_n_less_than_required,
+                multiprocessor=multiprocessor,
+                n_row_tile_min=n_row_block,
+            )
+
+            fdrs = full(p_values.size, nan)
+
+            is_good = isfinite(p_values)
+
+            if is_good.any():
+
+                fdrs[is_good] = _compute_benjamini_hochberg_fdrs(p_values[is_good])
+
+        else:
+
+            tiles = _tile_rows_and_permutations(
+                data.shape[0], n_permutation, n_job, n_row_tile_min=n_row_block
+            )
+
+            scores = score_moe_p_value_fdr["Score"].values
+
+            is_good = isfinite(scores)
+
+            if count_permutation_scores:
+
+                values = scores[is_good]
+
+            else:
+
+                values = None
+
+            outputs = multiprocess(
+                _read_data_rows_and_call,
+                (
                     (
-                        (
-                            target,
-                            data_,
-                            random_seed,
-                            n_permutation,
-                            match_function,
-                            n_required_for_match_function,
-                            raise_for_n_less_than_required,
-                        )
-                        for data_ in data_split
-                    ),
-                    n_job,
+                        _permute_target_and_match_target_and_data,
+                        target,
+                        data,
+                        rows,
+                        random_seed,
+                        n_permutation_,
+                        match_function,
+                        n_required_for_match_function,
+                        raise_for_n_less_than_required,
+                        permutation_start,
+                        values,
+                    )
+                    for rows, permutation_start, n_permutation_ in tiles
+                ),
+                n_job,
+                multiprocessor=multiprocessor,
+            )
+
+            if count_permutation_scores:
+
+                n_random_value = sum(output[2] for output in outputs)
+
+                p_values = full(scores.size, nan)
+
+                fdrs = full(scores.size, nan)
+
+                if is_good.any() and 0 < n_random_value:
+
+                    good_p_values, good_fdrs = _compute_empirical_p_values_and_fdrs_from_counts(
+                        sum(output[0] for output in outputs),
+                        sum(output[1] for output in outputs),
+                        n_random_value,
+                        "less_or_great",
+                    )
+
+                    p_values[is_good] = good_p_values
+
+                    fdrs[is_good] = good_fdrs
+
+            else:
+
+                index_x_permutation = full((data.shape[0], n_permutation), nan)
+
+                for (rows, permutation_start, n_permutation_), output in zip(
+                    tiles, outputs
+                ):
+
+                    index_x_permutation[
+                        rows, permutation_start : permutation_start + n_permutation_
+                    ] = output
+
+                p_values, fdrs = compute_empirical_p_values_and_fdrs(
+                    score_moe_p_value_fdr["Score"],
+                    index_x_permutation.flatten(),
+                    "less_or_great",
+                    raise_for_bad=False,
                 )
-            ).flatten(),
-            "less_or_great",
-            raise_for_bad=False,
-        )
+
+        score_moe_p_value_fdr["P-Value"] = p_values
+
+        score_moe_p_value_fdr["FDR"] = fdrs
+
+        if n_exceedance_to_stop is not None:
+
+            score_moe_p_value_fdr["N Permutation"] = n_permutations
 
     return score_moe_p_value_fdr
@@ -1,10 +1,11 @@
 from math import ceil
 
-from numpy import apply_along_axis, full, nan
-from numpy.random import choice, get_state, seed, set_state
+from numpy import apply_along_axis, array_split, concatenate
+from numpy.random import default_rng
 
-from ._match_target_and_data import _match_target_and_data
+from ._match_sampled_target_and_data import _match_sampled_target_and_data
 from .compute_nd_array_margin_of_error import compute_nd_array_margin_of_error
+from .multiprocess import multiprocess
 
 
 def _match_randomly_sampled_target_and_data_to_compute_margin_of_errors(
@@ -15,35 +16,50 @@ def _match_randomly_sampled_target_and_data_to_compute_margin_of_errors(
     match_function,
     n_required_for_match_function,
     raise_for_n_less_than_required,
+    n_job=1,
+    multiprocessor=None,
 ):
 
     print("Computing MoE with {} sampling ...".format(n_sampling))
 
-    seed(random_seed)
-
-    index_x_sampling = full((data.shape[0], n_sampling), nan)
-
-    n_sample = ceil(0.632 * target.size)
-
-    for i in range(n_sampling):
-
-        random_indices = choice(target.size, size=n_sample, replace=True)
-
-        sampled_target = target[random_indices]
+    sampling_x_index = default_rng(random_seed).integers(
+        target.size, size=(n_sampling, ceil(0.632 * target.size))
+    )
 
-        sampled_data = data[:, random_indices]
+    n_job = max(1, min(n_job, n_sampling))
 
-        random_state = get_state()
+    if n_job == 1 and multiprocessor is None:
 
-        index_x_sampling[:, i] = _match_target_and_data(
-            sampled_target,
-            sampled_data,
+        index_x_sampling = _match_sampled_target_and_data(
+            target,
+            data,
+            sampling_x_index,
             match_function,
             n_required_for_match_function,
             raise_for_n_less_than_required,
         )
 
-        set_state(random_state)
+    else:
+
+        index_x_sampling = concatenate(
+            multiprocess(
+                _match_sampled_target_and_data,
+                (
+                    (
+                        target,
+                        data,
+                        sampling_x_index_,
+                        match_function,
+                        n_required_for_match_function,
+                        raise_for_n_less_than_required,
+                    )
+                    for sampling_x_index_ in array_split(sampling_x_index, n_job)
+                ),
+                n_job,
+                multiprocessor=multiprocessor,
+            ),
+            axis=1,
+        )
 
     return apply_along_axis(
         compute_nd_array_margin_of_error, 1, index_x_sampling, raise_for_bad=False
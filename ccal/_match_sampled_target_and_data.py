@@ -0,0 +1,45 @@
+from numpy import full, isfinite, nan
+
+from ._group_rows_by_good_pattern import _group_rows_by_good_pattern
+from ._match_target_and_data import _match_target_and_data
+
+
+def _match_sampled_target_and_data(
+    target,
+    data,
+    sampling_x_index,
+    match_function,
+    n_required_for_match_function,
+    raise_for_n_less_than_required,
+):
+
+    index_x_sampling = full((data.shape[0], sampling_x_index.shape[0]), nan)
+
+    if getattr(match_function, "accepts_2d_array", False):
+
+        is_goods, group_indices = _group_rows_by_good_pattern(isfinite(data))
+
+    else:
+
+        is_goods = None
+
+    for i, indices in enumerate(sampling_x_index):
+
+        if is_goods is None:
+
+            is_goods_and_group_indices = None
+
+        else:
+
+            is_goods_and_group_indices = (is_goods[:, indices], group_indices)
+
+        index_x_sampling[:, i] = _match_target_and_data(
+            target[indices],
+            data[:, indices],
+            match_function,
+            n_required_for_match_function,
+            raise_for_n_less_than_required,
+            is_goods_and_group_indices=is_goods_and_group_indices,
+        )
+
+    return index_x_sampling
@@ -1,5 +1,17 @@
-from numpy import apply_along_axis
+from warnings import warn
 
+from numpy import (
+    apply_along_axis,
+    argsort,
+    bincount,
+    concatenate,
+    cumsum,
+    full,
+    isfinite,
+    nan,
+)
+
+from ._group_rows_by_good_pattern import _group_rows_by_good_pattern
 from .apply_function_on_2_1d_arrays import apply_function_on_2_1d_arrays
 
 
@@ -9,15 +21,135 @@ def _match_target_and_data(
     match_function,
     n_required_for_match_function,
     raise_for_n_less_than_required,
+    match_function_kwargs=None,
+    is_goods_and_group_indices=None,
 ):
 
-    return apply_along_axis(
-        apply_function_on_2_1d_arrays,
-        1,
-        data,
-        target,
-        match_function,
-        n_required=n_required_for_match_function,
-        raise_for_n_less_than_required=raise_for_n_less_than_required,
-        raise_for_bad=False,
-    )
+    if getattr(match_function, "accepts_2d_array", False):
+
+        if is_goods_and_group_indices is None:
+
+            is_goods, group_indices = _group_rows_by_good_pattern(
+                isfinite(data) & isfinite(target)
+            )
+
+        else:
+
+            is_goods, group_indices = is_goods_and_group_indices
+
+            is_good_target = isfinite(target)
+
+            if not is_good_target.all():
+
+                is_goods = is_goods & is_good_target
+
+        is_row_wise = (
+            group_indices is not None and data.shape[0] < 2 * is_goods.shape[0]
+        )
+
+    else:
+
+        is_row_wise = True
+
+    if is_row_wise:
+
+        return apply_along_axis(
+            apply_function_on_2_1d_arrays,
+            1,
+            data,
+            target,
+            match_function,
+            n_required=n_required_for_match_function,
+            raise_for_n_less_than_required=raise_for_n_less_than_required,
+            raise_for_bad=False,
+        )
+
+    scores = full(data.shape[0], nan)
+
+    if group_indices is not None:
+
+        row_indices = argsort(group_indices, kind="stable")
+
+        group_offsets = concatenate(
+            ((0,), cumsum(bincount(group_indices, minlength=is_goods.shape[0])))
+        )
+
+    n_required = n_required_for_match_function
+
+    if n_required is not None and n_required <= 1:
+
+        n_required *= target.size
+
+    n_row_less_than_required = 0
+
+    for i, is_good_ in enumerate(is_goods):
+
+        if group_indices is None:
+
+            rows = slice(None)
+
+            n_row = data.shape[0]
+
+        else:
+
+            rows = row_indices[group_offsets[i] : group_offsets[i + 1]]
+
+            n_row = rows.size
+
+        n_good = is_good_.sum()
+
+        if n_good == 0:
+
+            continue
+
+        if n_required is not None and n_good < n_required:
+
+            n_row_less_than_required += n_row
+
+            continue
+
+        if group_indices is None:
+
+            data_ = data
+
+        else:
+
+            data_ = data[rows]
+
+        if is_good_.all():
+
+            if match_function_kwargs is None:
+
+                match_function_kwargs_ = {}
+
+            else:
+
+                match_function_kwargs_ = match_function_kwargs
+
+            target_ = target
+
+        else:
+
+            match_function_kwargs_ = {}
+
+            data_ = data_[:, is_good_]
+
+            target_ = target[is_good_]
+
+        scores[rows] = match_function(data_, target_, **match_function_kwargs_)
+
+    if 0 < n_row_less_than_required:
+
+        message = "{} requires {} <= n ({} row).".format(
+            match_function.__name__, n_required, n_row_less_than_required
+        )
+
+        if raise_for_n_less_than_required:
+
+            raise ValueError(message)
+
+        else:
+
+            warn(message)
+
+    return scores
@@ -0,0 +1,46 @@
+from numpy import arange, array_split, concatenate
+
+from ._match_target_and_data import _match_target_and_data
+from ._read_data_rows_and_call import _read_data_rows_and_call
+from .multiprocess import multiprocess
+
+
+def _match_target_and_data_by_row_block(
+    target,
+    data,
+    n_job,
+    n_row_block,
+    match_function,
+    n_required_for_match_function,
+    raise_for_n_less_than_required,
+    multiprocessor=None,
+):
+
+    n_job = min(data.shape[0], n_job)
+
+    print(
+        "Computing score using {} with {} process ...".format(
+            match_function.__name__, n_job
+        )
+    )
+
+    return concatenate(
+        multiprocess(
+            _read_data_rows_and_call,
+            (
+                (
+                    _match_target_and_data,
+                    target,
+                    data,
+                    slice(rows[0], rows[-1] + 1),
+                    match_function,
+                    n_required_for_match_function,
+                    raise_for_n_less_than_required,
+                )
+                for rows in array_split(arange(data.shape[0]), max(n_job, n_row_block))
+                if rows.size
+            ),
+            n_job,
+            multiprocessor=multiprocessor,
+        )
+    )
@@ -0,0 +1,114 @@
+from numpy import full, isfinite, nan
+from pandas import DataFrame
+
+from ._compute_empirical_p_values_and_fdrs_from_counts import (
+    _compute_empirical_p_values_and_fdrs_from_counts,
+)
+from ._match_randomly_sampled_target_and_data_to_compute_margin_of_errors import (
+    _match_randomly_sampled_target_and_data_to_compute_margin_of_errors,
+)
+from ._match_target_and_data import _match_target_and_data
+from ._permute_target_and_match_target_and_data import (
+    _permute_target_and_match_target_and_data,
+)
+from .select_series_indices import select_series_indices
+
+
+def _match_target_and_data_using_data_invariants(
+    target,
+    data,
+    data_invariants,
+    match_function,
+    n_required_for_match_function,
+    raise_for_n_less_than_required,
+    n_extreme,
+    fraction_extreme,
+    random_seed,
+    n_sampling,
+    n_permutation,
+):
+
+    match_function_kwargs = data_invariants
+
+    if data_invariants is not None:
+
+        match_function_kwargs = {
+            **data_invariants,
+            **match_function.compute_permutation_invariants(None, target),
+        }
+
+    score_moe_p_value_fdr = DataFrame(columns=("Score", "0.95 MoE", "P-Value", "FDR"))
+
+    score_moe_p_value_fdr["Score"] = _match_target_and_data(
+        target,
+        data,
+        match_function,
+        n_required_for_match_function,
+        raise_for_n_less_than_required,
+        match_function_kwargs=match_function_kwargs,
+    )
+
+    if n_extreme is not None or fraction_extreme is not None:
+
+        indices = select_series_indices(
+            score_moe_p_value_fdr["Score"],
+            "<>",
+            n=n_extreme,
+            fraction=fraction_extreme,
+            plot=False,
+        )
+
+        score_moe_p_value_fdr.loc[indices, "0.95 MoE"] = (
+            _match_randomly_sampled_target_and_data_to_compute_margin_of_errors(
+                target,
+                data[indices],
+                random_seed,
+                n_sampling,
+                match_function,
+                n_required_for_match_function,
+                raise_for_n_less_than_required,
+            )
+        )
+
+        scores = score_moe_p_value_fdr["Score"].values
+
+        is_good = isfinite(scores)
+
+        (
+            n_less_equal_random_values,
+            n_great_equal_random_values,
+            n_random_value,
+        ) = _permute_target_and_match_target_and_data(
+            target,
+            data,
+            random_seed,
+            n_permutation,
+            match_function,
+            n_required_for_match_function,
+            raise_for_n_less_than_required,
+            values=scores[is_good],
+            match_function_kwargs=match_function_kwargs,
+        )
+
+        p_values = full(scores.size, nan)
+
+        fdrs = full(scores.size, nan)
+
+        if is_good.any() and 0 < n_random_value:
+
+            good_p_values, good_fdrs = _compute_empirical_p_values_and_fdrs_from_counts(
+                n_less_equal_random_values,
+                n_great_equal_random_values,
+                n_random_value,
+                "less_or_great",
+            )
+
+            p_values[is_good] = good_p_values
+
+            fdrs[is_good] = good_fdrs
+
+        score_moe_p_value_fdr["P-Value"] = p_values
+
+        score_moe_p_value_fdr["FDR"] = fdrs
+
+    return score_moe_p_value_fdr
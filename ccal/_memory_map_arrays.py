@@ -0,0 +1,116 @@
+from os import remove
+from os.path import isfile
+from weakref import finalize, ref
+from zlib import adler32
+
+from numpy import ascontiguousarray, ndarray, save
+from pandas import DataFrame
+
+from ._MemoryMappedArray import _MemoryMappedArray
+
+
+def _forget_memory_mapped_array(id_memory_mapped, id_, npy_file_path):
+
+    if id_ in id_memory_mapped and id_memory_mapped[id_][2] == npy_file_path:
+
+        id_memory_mapped.pop(id_)
+
+    if isfile(npy_file_path):
+
+        remove(npy_file_path)
+
+
+def _memory_map_arrays(
+    args, get_directory_path, n_byte_to_memory_map, id_memory_mapped, checked_ids
+):
+
+    args_ = []
+
+    for arg in args:
+
+        if isinstance(arg, ndarray) and arg.dtype.kind in "biuf":
+
+            nd_array = arg
+
+            index = columns = None
+
+        elif (
+            isinstance(arg, DataFrame)
+            and arg.dtypes.unique().size == 1
+            and arg.dtypes.iloc[0].kind in "biuf"
+        ):
+
+            nd_array = arg.values
+
+            index = arg.index
+
+            columns = arg.columns
+
+        else:
+
+            args_.append(arg)
+
+            continue
+
+        if nd_array.nbytes < n_byte_to_memory_map:
+
+            args_.append(arg)
+
+            continue
+
+        id_ = id(arg)
+
+        if id_ not in checked_ids:
+
+            version = (
+                nd_array.shape,
+                nd_array.dtype.str,
+                adler32(ascontiguousarray(nd_array).view("u1")),
+            )
+
+            if id_ in id_memory_mapped:
+
+                (
+                    reference,
+                    version_,
+                    npy_file_path,
+                    memory_mapped_array,
+                    finalizer,
+                ) = id_memory_mapped[id_]
+
+                if not (
+                    reference() is arg
+                    and version_ == version
+                    and memory_mapped_array._index is index
+                    and memory_mapped_array._columns is columns
+                ):
+
+                    finalizer()
+
+            if id_ not in id_memory_mapped:
+
+                npy_file_path = "{}/{}.npy".format(
+                    get_directory_path(nd_array.nbytes), id_
+                )
+
+                save(npy_file_path, nd_array)
+
+                id_memory_mapped[id_] = (
+                    ref(arg),
+                    version,
+                    npy_file_path,
+                    _MemoryMappedArray(npy_file_path, index=index, columns=columns),
+                    finalize(
+                        arg,
+                        _forget_memory_mapped_array,
+                        id_memory_mapped,
+                        id_,
+                        npy_file_path,
+                    ),
+                )
+
+            checked_ids.add(id_)
+
+        args_.append(id_memory_mapped[id_][3])
+
+    return args_
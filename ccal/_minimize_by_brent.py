@@ -0,0 +1,119 @@
+from numpy import absolute, errstate, finfo, full, sqrt, where
+
+eps = sqrt(finfo(float).eps)
+
+c = (3 - sqrt(5)) / 2
+
+
+def _minimize_by_brent(function, mins, maxs, tolerances, args=()):
+
+    # Vectorized port of R's Brent_fmin (optimize); each slot minimizes on its own
+
+    a = mins.astype(float)
+
+    b = maxs.astype(float)
+
+    x = a + c * (b - a)
+
+    w = x.copy()
+
+    v = x.copy()
+
+    d = full(x.size, 0.0)
+
+    e = full(x.size, 0.0)
+
+    fx = function(x, *args)
+
+    fw = fx.copy()
+
+    fv = fx.copy()
+
+    tol3 = tolerances / 3
+
+    while True:
+
+        xm = (a + b) / 2
+
+        tol1 = eps * absolute(x) + tol3
+
+        t2 = tol1 * 2
+
+        is_active = t2 - (b - a) / 2 < absolute(x - xm)
+
+        if not is_active.any():
+
+            break
+
+        is_fit = tol1 < absolute(e)
+
+        r = (x - w) * (fx - fv)
+
+        q = (x - v) * (fx - fw)
+
+        p = (x - v) * q - (x - w) * r
+
+        q = (q - r) * 2
+
+        p = where(0 < q, -p, p)
+
+        q = absolute(q)
+
+        p = where(is_fit, p, 0)
+
+        q = where(is_fit, q, 0)
+
+        r = where(is_fit, e, 0)
+
+        e = where(is_fit, d, e)
+
+        is_golden = (
+            (absolute(q * 0.5 * r) <= absolute(p))
+            | (p <= q * (a - x))
+            | (q * (b - x) <= p)
+        )
+
+        e = where(is_golden, where(x < xm, b - x, a - x), e)
+
+        with errstate(divide="ignore", invalid="ignore"):
+
+            d = where(is_golden, c * e, p / q)
+
+        u = x + d
+
+        is_near_end = ~is_golden & ((u - a < t2) | (b - u < t2))
+
+        d = where(is_near_end, where(xm <= x, -tol1, tol1), d)
+
+        u = where(tol1 <= absolute(d), x + d, where(0 < d, x + tol1, x - tol1))
+
+        fu = fx.copy()
+
+        fu[is_active] = function(u[is_active], *(arg[is_active] for arg in args))
+
+        is_better = is_active & (fu <= fx)
+
+        is_worse = is_active & ~(fu <= fx)
+
+        is_w = is_worse & ((fu <= fw) | (w == x))
+
+        is_v = is_worse & ~is_w & ((fu <= fv) | (v == x) | (v == w))
+
+        a, b = (
+            where(is_better & (x <= u), x, where(is_worse & (u < x), u, a)),
+            where(is_better & (u < x), x, where(is_worse & (x <= u), u, b)),
+        )
+
+        v, fv = (
+            where(is_better | is_w, w, where(is_v, u, v)),
+            where(is_better | is_w, fw, where(is_v, fu, fv)),
+        )
+
+        w, fw = (
+            where(is_better, x, where(is_w, u, w)),
+            where(is_better, fx, where(is_w, fu, fw)),
+        )
+
+        x, fx = where(is_better, u, x), where(is_better, fu, fx)
+
+    return x
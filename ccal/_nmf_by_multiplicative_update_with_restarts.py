@@ -0,0 +1,131 @@
+from numpy import absolute, arange, empty, full, nan, sqrt
+from numpy.random import default_rng
+
+from ._compute_norm_by_trace_identity import _compute_norm_by_trace_identity
+
+
+def _nmf_by_multiplicative_update_with_restarts(
+    V,
+    k,
+    restarts,
+    n_iteration=int(1e3),
+    random_seed=20121020,
+    tolerance=None,
+    n_iteration_per_check=10,
+):
+
+    print("NMF with K={} and {} restart ...".format(k, len(restarts)))
+
+    n_row, n_column = V.shape
+
+    scale = sqrt(V.mean() / k)
+
+    W = empty((len(restarts), n_row, k))
+
+    H = empty((len(restarts), k, n_column))
+
+    for i, restart in enumerate(restarts):
+
+        random_generator = default_rng((random_seed, restart))
+
+        W[i] = absolute(random_generator.standard_normal(size=(n_row, k))) * scale
+
+        H[i] = absolute(random_generator.standard_normal(size=(k, n_column))) * scale
+
+    W_clusters = empty((len(restarts), n_row), dtype=int)
+
+    H_clusters = empty((len(restarts), n_column), dtype=int)
+
+    R_norms = full(len(restarts), nan)
+
+    indices = arange(len(restarts))
+
+    V_norm_squared = (V ** 2).sum()
+
+    HHt = H @ H.transpose(0, 2, 1)
+
+    WtW = W.transpose(0, 2, 1) @ W
+
+    WtV = (W.transpose(0, 2, 1).reshape(-1, n_row) @ V).reshape(-1, k, n_column)
+
+    R_norms_0 = _compute_norm_by_trace_identity(V_norm_squared, H, WtV, WtW, HHt)
+
+    R_norms_at_check = R_norms_0
+
+    for i in range(n_iteration):
+
+        W *= (V @ H.reshape(-1, n_column).T).reshape(n_row, -1, k).transpose(
+            1, 0, 2
+        ) / (W @ HHt)
+
+        WtW = W.transpose(0, 2, 1) @ W
+
+        WtV = (W.transpose(0, 2, 1).reshape(-1, n_row) @ V).reshape(-1, k, n_column)
+
+        H *= WtV / (WtW @ H)
+
+        HHt = H @ H.transpose(0, 2, 1)
+
+        if tolerance is not None and (i + 1) % n_iteration_per_check == 0:
+
+            R_norms_ = _compute_norm_by_trace_identity(
+                V_norm_squared, H, WtV, WtW, HHt
+            )
+
+            is_converged = (R_norms_at_check - R_norms_) / R_norms_0 < tolerance
+
+            if is_converged.any():
+
+                W_clusters[indices[is_converged]] = W[is_converged].argmax(axis=2)
+
+                H_clusters[indices[is_converged]] = H[is_converged].argmax(axis=1)
+
+                if indices[0] == 0 and is_converged[0]:
+
+                    W_0 = W[0].copy()
+
+                    H_0 = H[0].copy()
+
+                R_norms[indices[is_converged]] = R_norms_[is_converged]
+
+                is_running = ~is_converged
+
+                indices = indices[is_running]
+
+                if indices.size == 0:
+
+                    break
+
+                W = W[is_running]
+
+                H = H[is_running]
+
+                HHt = HHt[is_running]
+
+                WtW = WtW[is_running]
+
+                WtV = WtV[is_running]
+
+                R_norms_0 = R_norms_0[is_running]
+
+                R_norms_ = R_norms_[is_running]
+
+            R_norms_at_check = R_norms_
+
+    if indices.size:
+
+        W_clusters[indices] = W.argmax(axis=2)
+
+        H_clusters[indices] = H.argmax(axis=1)
+
+        if indices[0] == 0:
+
+            W_0 = W[0]
+
+            H_0 = H[0]
+
+        R_norms[indices] = _compute_norm_by_trace_identity(
+            V_norm_squared, H, WtV, WtW, HHt
+        )
+
+    return W_0, H_0, W_clusters, H_clusters, R_norms
@@ -0,0 +1,40 @@
+from numpy import empty
+
+from .nmf_by_sklearn import nmf_by_sklearn
+
+
+def _nmf_by_sklearn_with_restarts(
+    V, k, restarts, n_iteration=int(1e3), random_seed=20121020
+):
+
+    print("NMF with K={} and {} restart ...".format(k, len(restarts)))
+
+    w_element_clusters = empty((len(restarts), V.shape[0]), dtype=int)
+
+    h_element_clusters = empty((len(restarts), V.shape[1]), dtype=int)
+
+    R_norms = empty(len(restarts))
+
+    n_per_print = max(1, len(restarts) // 10)
+
+    for i, restart in enumerate(restarts):
+
+        if i % n_per_print == 0:
+
+            print("\t(K={}) {}/{} ...".format(k, i + 1, len(restarts)))
+
+        W, H, R_norms[i] = nmf_by_sklearn(
+            V, k, n_iteration=n_iteration, random_seed=random_seed + restart
+        )
+
+        if i == 0:
+
+            W_0 = W
+
+            H_0 = H
+
+        w_element_clusters[i] = W.argmax(axis=1)
+
+        h_element_clusters[i] = H.argmax(axis=0)
+
+    return W_0, H_0, w_element_clusters, h_element_clusters, R_norms
@@ -0,0 +1,28 @@
+from ._nmf_by_multiplicative_update_with_restarts import (
+    _nmf_by_multiplicative_update_with_restarts,
+)
+from ._nmf_by_sklearn_with_restarts import _nmf_by_sklearn_with_restarts
+
+
+def _nmf_with_restarts(V, k, restarts, solver, n_iteration, random_seed, tolerance):
+
+    if solver == "sklearn":
+
+        return _nmf_by_sklearn_with_restarts(
+            V, k, restarts, n_iteration=n_iteration, random_seed=random_seed
+        )
+
+    elif solver == "multiplicative_update":
+
+        return _nmf_by_multiplicative_update_with_restarts(
+            V,
+            k,
+            restarts,
+            n_iteration=n_iteration,
+            random_seed=random_seed,
+            tolerance=tolerance,
+        )
+
+    else:
+
+        raise ValueError("Unknown solver: {}.".format(solver))
@@ -0,0 +1,42 @@
+from numpy import arange, concatenate, full, nan
+from numpy.random import default_rng
+
+from ._compute_single_sample_gsea_scores import _compute_single_sample_gsea_scores
+
+
+def _permute_genes_and_compute_gsea_scores(
+    gene_scores,
+    n_gene_set_gene,
+    statistic,
+    random_seed,
+    n_permutation,
+    n_value_per_block=2 ** 22,
+):
+
+    print("Computing GSEA scores with {} gene permutation ...".format(n_permutation))
+
+    n_permutation_per_block = max(1, n_value_per_block // max(1, n_gene_set_gene))
+
+    gene_scores = gene_scores.reshape(-1, 1)
+
+    scores = full(n_permutation, nan)
+
+    for start in range(0, n_permutation, n_permutation_per_block):
+
+        end = min(start + n_permutation_per_block, n_permutation)
+
+        scores[start:end] = _compute_single_sample_gsea_scores(
+            gene_scores,
+            concatenate(
+                [
+                    default_rng((random_seed, i)).choice(
+                        gene_scores.shape[0], size=n_gene_set_gene, replace=False
+                    )
+                    for i in range(start, end)
+                ]
+            ),
+            arange(end - start + 1) * n_gene_set_gene,
+            statistic,
+        )[:, 0]
+
+    return scores
@@ -0,0 +1,63 @@
+from numpy import full, isfinite, nan
+from numpy.random import default_rng
+
+from ._compute_single_sample_gsea_scores import _compute_single_sample_gsea_scores
+from ._group_rows_by_good_pattern import _group_rows_by_good_pattern
+from ._match_target_and_data import _match_target_and_data
+
+
+def _permute_phenotypes_and_compute_gsea_scores(
+    gene_x_sample,
+    phenotypes,
+    function,
+    function_kwargs,
+    gene_indices,
+    gene_set_offsets,
+    statistic,
+    random_seed,
+    permutation_start,
+    n_permutation,
+    n_value_per_block=2 ** 22,
+):
+
+    print("Computing GSEA scores with {} permutation ...".format(n_permutation))
+
+    n_permutation_per_block = max(1, n_value_per_block // gene_x_sample.shape[0])
+
+    if getattr(function, "accepts_2d_array", False):
+
+        is_goods_and_group_indices = _group_rows_by_good_pattern(
+            isfinite(gene_x_sample)
+        )
+
+    else:
+
+        is_goods_and_group_indices = None
+
+    scores = full(n_permutation, nan)
+
+    for start in range(0, n_permutation, n_permutation_per_block):
+
+        end = min(start + n_permutation_per_block, n_permutation)
+
+        gene_x_permutation = full((gene_x_sample.shape[0], end - start), nan)
+
+        for i in range(start, end):
+
+            gene_x_permutation[:, i - start] = _match_target_and_data(
+                default_rng((random_seed, permutation_start + i)).permutation(
+                    phenotypes
+                ),
+                gene_x_sample,
+                function,
+                None,
+                False,
+                match_function_kwargs=function_kwargs,
+                is_goods_and_group_indices=is_goods_and_group_indices,
+            )
+
+        scores[start:end] = _compute_single_sample_gsea_scores(
+            gene_x_permutation, gene_indices, gene_set_offsets, statistic
+        )[0]
+
+    return scores
@@ -1,6 +1,10 @@
-from numpy import full, nan
-from numpy.random import get_state, seed, set_state, shuffle
+from numpy import full, isfinite, nan, zeros
+from numpy.random import default_rng
 
+from ._count_random_values_less_equal_and_great_equal import (
+    _count_random_values_less_equal_and_great_equal,
+)
+from ._group_rows_by_good_pattern import _group_rows_by_good_pattern
 from ._match_target_and_data import _match_target_and_data
 
 
@@ -12,30 +16,90 @@ def _permute_target_and_match_target_and_data(
     match_function,
     n_required_for_match_function,
     raise_for_n_less_than_required,
+    permutation_start=0,
+    values=None,
+    n_permutation_score_to_hold=2 ** 20,
+    match_function_kwargs=None,
 ):
 
     print("Computing p-value and FDR with {} permutation ...".format(n_permutation))
 
-    seed(random_seed)
+    is_good = isfinite(data)
 
-    index_x_permutation = full((data.shape[0], n_permutation), nan)
+    if getattr(match_function, "accepts_2d_array", False):
 
-    permuted_target = target.copy()
+        is_goods_and_group_indices = _group_rows_by_good_pattern(is_good)
 
-    for i in range(n_permutation):
+    else:
+
+        is_goods_and_group_indices = None
+
+    if match_function_kwargs is None and hasattr(
+        match_function, "compute_permutation_invariants"
+    ):
+
+        is_good_row = is_good.all(axis=1)
+
+        if isfinite(target).all() and is_good_row.any():
+
+            match_function_kwargs = match_function.compute_permutation_invariants(
+                data[is_good_row], target
+            )
+
+    if values is None:
+
+        n_permutation_to_hold = n_permutation
+
+    else:
+
+        n_permutation_to_hold = max(
+            1, min(n_permutation, n_permutation_score_to_hold // data.shape[0])
+        )
+
+        n_less_equal_random_values = zeros(values.size, dtype=int)
 
-        shuffle(permuted_target)
+        n_great_equal_random_values = zeros(values.size, dtype=int)
 
-        random_state = get_state()
+        n_random_value = 0
 
-        index_x_permutation[:, i] = _match_target_and_data(
-            permuted_target,
+    index_x_permutation = full((data.shape[0], n_permutation_to_hold), nan)
+
+    for i in range(n_permutation):
+
+        i_ = i % n_permutation_to_hold
+
+        index_x_permutation[:, i_] = _match_target_and_data(
+            default_rng((random_seed, permutation_start + i)).permutation(target),
             data,
             match_function,
             n_required_for_match_function,
             raise_for_n_less_than_required,
+            match_function_kwargs=match_function_kwargs,
+            is_goods_and_group_indices=is_goods_and_group_indices,
         )
 
-        set_state(random_state)
+        if values is not None and (
+            i_ == n_permutation_to_hold - 1 or i == n_permutation - 1
+        ):
+
+            (
+                n_less_equal_random_values_,
+                n_great_equal_random_values_,
+                n_random_value_,
+            ) = _count_random_values_less_equal_and_great_equal(
+                values, index_x_permutation[:, : i_ + 1]
+            )
+
+            n_less_equal_random_values += n_less_equal_random_values_
+
+            n_great_equal_random_values += n_great_equal_random_values_
+
+            n_random_value += n_random_value_
+
+    if values is None:
+
+        return index_x_permutation
+
+    else:
 
-    return index_x_permutation
+        return n_less_equal_random_values, n_great_equal_random_values, n_random_value
@@ -0,0 +1,91 @@
+from .plot_heat_map import plot_heat_map
+
+
+def _plot_nmf_consensus_clusters(
+    df,
+    k,
+    w_0,
+    h_0,
+    w_element_cluster,
+    h_element_cluster,
+    plot_w,
+    plot_h,
+    plot_df,
+    directory_path,
+):
+
+    if plot_w:
+
+        print("Plotting w ...")
+
+        file_name = "w.html"
+
+        if directory_path is None:
+
+            html_file_path = None
+
+        else:
+
+            html_file_path = "{}/{}".format(directory_path, file_name)
+
+        plot_heat_map(
+            w_0,
+            normalization_axis=1,
+            normalization_method="-0-",
+            cluster_axis=0,
+            title="NMF K{} W".format(k),
+            xaxis_title=w_0.columns.name,
+            yaxis_title=w_0.index.name,
+            html_file_path=html_file_path,
+        )
+
+    if plot_h:
+
+        print("Plotting h ...")
+
+        file_name = "h.html"
+
+        if directory_path is None:
+
+            html_file_path = None
+
+        else:
+
+            html_file_path = "{}/{}".format(directory_path, file_name)
+
+        plot_heat_map(
+            h_0,
+            normalization_axis=0,
+            normalization_method="-0-",
+            cluster_axis=1,
+            title="NMF K{} H".format(k),
+            xaxis_title=h_0.columns.name,
+            yaxis_title=h_0.index.name,
+            html_file_path=html_file_path,
+        )
+
+    if plot_df:
+
+        print("Plotting df ...")
+
+        file_name = "cluster.html"
+
+        if directory_path is None:
+
+            html_file_path = None
+
+        else:
+
+            html_file_path = "{}/{}".format(directory_path, file_name)
+
+        plot_heat_map(
+            df,
+            normalization_axis=0,
+            normalization_method="-0-",
+            row_annotation=w_element_cluster,
+            column_annotation=h_element_cluster,
+            title="NMFCC K={} W H Element Cluster".format(k),
+            xaxis_title=df.columns.name,
+            yaxis_title=df.index.name,
+            html_file_path=html_file_path,
+        )
@@ -0,0 +1,6 @@
+from ._read_rows import _read_rows
+
+
+def _read_data_rows_and_call(callable_, target, data, rows, *args):
+
+    return callable_(target, _read_rows(data, rows), *args)
@@ -0,0 +1,12 @@
+from .MatrixFile import MatrixFile
+
+
+def _read_rows(data, rows):
+
+    if isinstance(data, MatrixFile):
+
+        return data.read(rows)
+
+    else:
+
+        return data[rows]
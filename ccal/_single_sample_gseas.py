@@ -1,24 +1,50 @@
-from numpy import full, nan
+from warnings import warn
+
+from numpy import full, isnan, nan
 from pandas import DataFrame
 
-from .single_sample_gsea import single_sample_gsea
+from ._compute_single_sample_gsea_scores import _compute_single_sample_gsea_scores
+from ._get_gene_indices_and_gene_set_offsets import (
+    _get_gene_indices_and_gene_set_offsets,
+)
 
 
-def _single_sample_gseas(gene_x_sample, gene_sets, statistic):
+def _single_sample_gseas(
+    gene_x_sample, gene_sets, statistic, n_value_per_block=2 ** 22
+):
 
     print("Running single-sample GSEA with {} gene sets ...".format(gene_sets.shape[0]))
 
+    gene_indices, gene_set_offsets = _get_gene_indices_and_gene_set_offsets(
+        gene_sets, gene_x_sample.index
+    )
+
+    n_sample_per_block = max(
+        1, n_value_per_block // max(gene_x_sample.shape[0], gene_indices.size, 1)
+    )
+
+    gene_x_sample_values = gene_x_sample.values.astype(float)
+
     score__gene_set_x_sample = full((gene_sets.shape[0], gene_x_sample.shape[1]), nan)
 
-    for sample_index, (sample_name, gene_score) in enumerate(gene_x_sample.items()):
+    for start in range(0, gene_x_sample.shape[1], n_sample_per_block):
+
+        end = start + n_sample_per_block
+
+        score__gene_set_x_sample[:, start:end] = _compute_single_sample_gsea_scores(
+            gene_x_sample_values[:, start:end],
+            gene_indices,
+            gene_set_offsets,
+            statistic,
+        )
+
+    n_nan = isnan(score__gene_set_x_sample).sum()
 
-        for gene_set_index, (gene_set_name, gene_set_genes) in enumerate(
-            gene_sets.iterrows()
-        ):
+    if 0 < n_nan:
 
-            score__gene_set_x_sample[gene_set_index, sample_index] = single_sample_gsea(
-                gene_score, gene_set_genes, statistic=statistic, plot=False
-            )
+        warn(
+            "{} gene set x sample did not have any of the gene-set genes.".format(n_nan)
+        )
 
     score__gene_set_x_sample = DataFrame(
         score__gene_set_x_sample, index=gene_sets.index, columns=gene_x_sample.columns
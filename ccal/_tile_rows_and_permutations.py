@@ -0,0 +1,18 @@
+from math import ceil
+
+from numpy import arange, array_split
+
+
+def _tile_rows_and_permutations(n_row, n_permutation, n_job, n_row_tile_min=1):
+
+    n_row_tile = max(1, min(n_row, max(n_job, n_row_tile_min)))
+
+    n_permutation_tile = max(1, min(n_permutation, ceil(n_job / n_row_tile)))
+
+    return tuple(
+        (slice(rows[0], rows[-1] + 1), permutations[0], permutations.size)
+        for rows in array_split(arange(n_row), n_row_tile)
+        if rows.size
+        for permutations in array_split(arange(n_permutation), n_permutation_tile)
+        if permutations.size
+    )
@@ -0,0 +1,138 @@
+from math import ceil
+
+from numpy import arange, array_split, full, isfinite, nan, triu
+
+from ._apply_function_on_2_2d_arrays_slices_tile import (
+    _apply_function_on_2_2d_arrays_slices_tile,
+)
+from .multiprocess import multiprocess
+
+
+def apply_function_on_2_2d_arrays_slices_in_tiles(
+    _2d_array_0,
+    _2d_array_1,
+    function,
+    axis,
+    n_job=1,
+    n_slice_per_tile=128,
+    n_required=None,
+    raise_for_n_less_than_required=True,
+):
+
+    is_symmetric = _2d_array_1 is None
+
+    if axis == 0:
+
+        _2d_array_0 = _2d_array_0.T
+
+        if not is_symmetric:
+
+            _2d_array_1 = _2d_array_1.T
+
+    if is_symmetric:
+
+        _2d_array_1 = _2d_array_0
+
+    invariants_0 = None
+
+    invariants_1 = None
+
+    if (
+        hasattr(function, "compute_permutation_invariants")
+        and isfinite(_2d_array_0).all()
+        and isfinite(_2d_array_1).all()
+    ):
+
+        print("Computing {} invariants ...".format(function.__name__))
+
+        invariants_0 = function.compute_permutation_invariants(_2d_array_0, None)
+
+        if is_symmetric:
+
+            invariants_1 = invariants_0
+
+        else:
+
+            invariants_1 = function.compute_permutation_invariants(_2d_array_1, None)
+
+        invariants_1 = {
+            "y{}".format(key[1:]): value for key, value in invariants_1.items()
+        }
+
+    slices_0 = [
+        slice(indices[0], indices[-1] + 1)
+        for indices in array_split(
+            arange(_2d_array_0.shape[0]),
+            max(1, ceil(_2d_array_0.shape[0] / n_slice_per_tile)),
+        )
+        if indices.size
+    ]
+
+    if is_symmetric:
+
+        slices_1 = slices_0
+
+        tiles = tuple(
+            (slice_0, slice_1)
+            for i_0, slice_0 in enumerate(slices_0)
+            for slice_1 in slices_1[i_0:]
+        )
+
+    else:
+
+        slices_1 = [
+            slice(indices[0], indices[-1] + 1)
+            for indices in array_split(
+                arange(_2d_array_1.shape[0]),
+                max(1, ceil(_2d_array_1.shape[0] / n_slice_per_tile)),
+            )
+            if indices.size
+        ]
+
+        tiles = tuple(
+            (slice_0, slice_1) for slice_0 in slices_0 for slice_1 in slices_1
+        )
+
+    print(
+        "Applying {} on {} tile with {} process ...".format(
+            function.__name__, len(tiles), n_job
+        )
+    )
+
+    _2d_array = full((_2d_array_0.shape[0], _2d_array_1.shape[0]), nan)
+
+    for (slice_0, slice_1), _2d_array_ in zip(
+        tiles,
+        multiprocess(
+            _apply_function_on_2_2d_arrays_slices_tile,
+            (
+                (
+                    _2d_array_0[slice_0],
+                    _2d_array_1[slice_1],
+                    function,
+                    None
+                    if invariants_0 is None
+                    else {
+                        key: value[slice_0] for key, value in invariants_0.items()
+                    },
+                    None
+                    if invariants_1 is None
+                    else {
+                        key: value[slice_1] for key, value in invariants_1.items()
+                    },
+                    n_required,
+                    raise_for_n_less_than_required,
+                )
+                for slice_0, slice_1 in tiles
+            ),
+            n_job,
+        ),
+    ):
+
+        _2d_array[slice_0, slice_1] = _2d_array_
+
+    if is_symmetric:
+
+        _2d_array = triu(_2d_array) + triu(_2d_array, k=1).T
+
+    return _2d_array
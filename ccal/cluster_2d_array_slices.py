@@ -1,11 +1,12 @@
 from numpy import concatenate, where
 from scipy.cluster.hierarchy import dendrogram, linkage
 
-from ._ignore_bad_and_compute_euclidean_distance_between_2_1d_arrays import (
-    _ignore_bad_and_compute_euclidean_distance_between_2_1d_arrays,
+from ._ignore_bad_and_compute_euclidean_distances import (
+    _ignore_bad_and_compute_euclidean_distances,
 )
 from .check_nd_array_for_bad import check_nd_array_for_bad
 from .get_1d_array_unique_objects_in_order import get_1d_array_unique_objects_in_order
+from .multiprocess import multiprocess
 
 
 def cluster_2d_array_slices(
@@ -16,6 +17,8 @@ def cluster_2d_array_slices(
     linkage_method="average",
     optimal_ordering=True,
     raise_for_bad=True,
+    n_job=1,
+    multiprocessor=None,
 ):
 
     check_nd_array_for_bad(_2d_array, raise_for_bad=raise_for_bad)
@@ -24,17 +27,19 @@ def cluster_2d_array_slices(
 
         _2d_array = _2d_array.T
 
-    if distance_function is None:
+    if groups is None:
 
-        distance_function = (
-            _ignore_bad_and_compute_euclidean_distance_between_2_1d_arrays
-        )
+        if distance_function is None:
 
-    if groups is None:
+            distances = _ignore_bad_and_compute_euclidean_distances(_2d_array)
+
+        else:
+
+            distances = _2d_array
 
         return dendrogram(
             linkage(
-                _2d_array,
+                distances,
                 method=linkage_method,
                 metric=distance_function,
                 optimal_ordering=optimal_ordering,
@@ -52,22 +57,41 @@ def cluster_2d_array_slices(
                 )
             )
 
-        indices = []
+        groups_indices = tuple(
+            where(groups == i)[0]
+            for i in get_1d_array_unique_objects_in_order(groups)
+        )
 
-        for i in get_1d_array_unique_objects_in_order(groups):
+        args = tuple(
+            (
+                _2d_array[group_indices, :],
+                0,
+                None,
+                distance_function,
+                linkage_method,
+                optimal_ordering,
+                False,
+            )
+            for group_indices in groups_indices
+        )
+
+        n_job = max(1, min(n_job, len(groups_indices)))
+
+        if n_job == 1 and multiprocessor is None:
 
-            group_indices = where(groups == i)[0]
+            clustered_indices_ = tuple(cluster_2d_array_slices(*args_) for args_ in args)
 
-            clustered_indices = dendrogram(
-                linkage(
-                    _2d_array[group_indices, :],
-                    method=linkage_method,
-                    metric=distance_function,
-                    optimal_ordering=optimal_ordering,
-                ),
-                no_plot=True,
-            )["leaves"]
+        else:
 
-            indices.append(group_indices[clustered_indices])
+            clustered_indices_ = multiprocess(
+                cluster_2d_array_slices, args, n_job, multiprocessor=multiprocessor
+            )
 
-        return concatenate(indices)
+        return concatenate(
+            [
+                group_indices[clustered_indices]
+                for group_indices, clustered_indices in zip(
+                    groups_indices, clustered_indices_
+                )
+            ]
+        )
@@ -1,8 +1,12 @@
-from numpy import asarray, full, nan, where
-from statsmodels.sandbox.stats.multicomp import multipletests
-
+from numpy import asarray, full, nan
+
+from ._compute_empirical_p_values_and_fdrs_from_counts import (
+    _compute_empirical_p_values_and_fdrs_from_counts,
+)
+from ._count_random_values_less_equal_and_great_equal import (
+    _count_random_values_less_equal_and_great_equal,
+)
 from .check_nd_array_for_bad import check_nd_array_for_bad
-from .compute_empirical_p_value import compute_empirical_p_value
 
 
 def compute_empirical_p_values_and_fdrs(
@@ -21,55 +25,20 @@ def compute_empirical_p_values_and_fdrs(
 
     if is_good.any() and is_good_random_value.any():
 
-        values_good = values[is_good]
-
-        random_values_good = random_values[is_good_random_value]
-
-        if p_value_direction in ("less_or_great", "less"):
-
-            good_p_values_less = asarray(
-                tuple(
-                    compute_empirical_p_value(value_good, random_values_good, "less")
-                    for value_good in values_good
-                )
-            )
-
-            good_fdrs_less = multipletests(good_p_values_less, method="fdr_bh")[1]
-
-        if p_value_direction in ("less_or_great", "great"):
-
-            good_p_values_great = asarray(
-                tuple(
-                    compute_empirical_p_value(value_good, random_values_good, "great")
-                    for value_good in values_good
-                )
-            )
-
-            good_fdrs_great = multipletests(good_p_values_great, method="fdr_bh")[1]
-
-        if p_value_direction == "less_or_great":
-
-            good_p_values = where(
-                good_p_values_less < good_p_values_great,
-                good_p_values_less,
-                good_p_values_great,
-            )
-
-            good_fdrs = where(
-                good_fdrs_less < good_fdrs_great, good_fdrs_less, good_fdrs_great
-            )
-
-        elif p_value_direction == "less":
-
-            good_p_values = good_p_values_less
-
-            good_fdrs = good_fdrs_less
-
-        elif p_value_direction == "great":
-
-            good_p_values = good_p_values_great
-
-            good_fdrs = good_fdrs_great
+        (
+            n_less_equal_random_values,
+            n_great_equal_random_values,
+            n_random_value,
+        ) = _count_random_values_less_equal_and_great_equal(
+            asarray(values[is_good]), random_values[is_good_random_value]
+        )
+
+        good_p_values, good_fdrs = _compute_empirical_p_values_and_fdrs_from_counts(
+            n_less_equal_random_values,
+            n_great_equal_random_values,
+            n_random_value,
+            p_value_direction,
+        )
 
         p_values[is_good] = good_p_values
 
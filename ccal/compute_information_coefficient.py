@@ -1,65 +1,43 @@
-import rpy2.robjects as ro
-from numpy import asarray, exp, finfo, isnan, log, nan, sign, sqrt, unique
-from rpy2.robjects.numpy2ri import numpy2ri
-from rpy2.robjects.packages import importr
-from scipy.stats import pearsonr
+from numpy import asarray, atleast_1d
 
-eps = finfo(float).eps
+from ._compute_information_coefficient_permutation_invariants import (
+    _compute_information_coefficient_permutation_invariants,
+)
+from ._compute_information_coefficients import _compute_information_coefficients
 
-ro.conversion.py2ri = numpy2ri
 
-mass = importr("MASS")
+def compute_information_coefficient(
+    x, y, n_grid=24, backend="numpy", x_bcv_bandwidth=None, y_bcv_bandwidth=None
+):
 
+    x = asarray(x)
 
-def compute_information_coefficient(x, y, n_grid=24):
+    y = asarray(y)
 
-    pearson_correlation = pearsonr(x, y)[0]
+    if x_bcv_bandwidth is not None:
 
-    if isnan(pearson_correlation) or unique(x).size == 1 or unique(y).size == 1:
+        x_bcv_bandwidth = atleast_1d(x_bcv_bandwidth)
 
-        return nan
+    information_coefficients = _compute_information_coefficients(
+        x.reshape(-1, x.shape[-1]),
+        y,
+        n_grid=n_grid,
+        backend=backend,
+        bcv_bandwidths_0=x_bcv_bandwidth,
+        bcv_bandwidth_1=y_bcv_bandwidth,
+    )
 
-    else:
-
-        pearson_correlation_abs = abs(pearson_correlation)
-
-        bandwidth_x = mass.bcv(x)[0] * (1 - pearson_correlation_abs * 0.75)
-
-        bandwidth_y = mass.bcv(y)[0] * (1 - pearson_correlation_abs * 0.75)
-
-        fxy = (
-            asarray(
-                mass.kde2d(
-                    x, y, asarray((bandwidth_x, bandwidth_y)), n=asarray((n_grid,))
-                )[2]
-            )
-            + eps
-        )
-
-        dx = (x.max() - x.min()) / (n_grid - 1)
+    if x.ndim == 1:
 
-        dy = (y.max() - y.min()) / (n_grid - 1)
+        return information_coefficients[0]
 
-        pxy = fxy / (fxy.sum() * dx * dy)
-
-        px = pxy.sum(axis=1) * dy
-
-        py = pxy.sum(axis=0) * dx
-
-        mi = (
-            (
-                pxy * log(pxy / (asarray((px,) * n_grid).T * asarray((py,) * n_grid)))
-            ).sum()
-            * dx
-            * dy
-        )
-
-        # hxy = - (pxy * log(pxy)).sum() * dx * dy
+    else:
 
-        # hx = -(px * log(px)).sum() * dx
+        return information_coefficients
 
-        # hy = -(py * log(py)).sum() * dy
 
-        # mi = hx + hy - hxy
+compute_information_coefficient.accepts_2d_array = True
 
-        return sign(pearson_correlation) * sqrt(1 - exp(-2 * mi))
+compute_information_coefficient.compute_permutation_invariants = (
+    _compute_information_coefficient_permutation_invariants
+)
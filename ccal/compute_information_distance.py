@@ -1,6 +1,28 @@
+from ._compute_information_coefficient_permutation_invariants import (
+    _compute_information_coefficient_permutation_invariants,
+)
 from .compute_information_coefficient import compute_information_coefficient
 
 
-def compute_information_distance(x, y, n_grid=24):
+def compute_information_distance(
+    x, y, n_grid=24, backend="numpy", x_bcv_bandwidth=None, y_bcv_bandwidth=None
+):
 
-    return (1 - compute_information_coefficient(x, y, n_grid=n_grid)) / 2
+    return (
+        1
+        - compute_information_coefficient(
+            x,
+            y,
+            n_grid=n_grid,
+            backend=backend,
+            x_bcv_bandwidth=x_bcv_bandwidth,
+            y_bcv_bandwidth=y_bcv_bandwidth,
+        )
+    ) / 2
+
+
+compute_information_distance.accepts_2d_array = True
+
+compute_information_distance.compute_permutation_invariants = (
+    _compute_information_coefficient_permutation_invariants
+)
@@ -0,0 +1,19 @@
+from numpy import asarray, clip, errstate, sqrt
+
+
+def compute_pearson_correlation(x, y):
+
+    x = asarray(x)
+
+    y = asarray(y)
+
+    x = x - x.mean(axis=-1, keepdims=True)
+
+    y = y - y.mean()
+
+    with errstate(divide="ignore", invalid="ignore"):
+
+        return clip((x @ y) / sqrt((x ** 2).sum(axis=-1) * (y ** 2).sum()), -1, 1)
+
+
+compute_pearson_correlation.accepts_2d_array = True
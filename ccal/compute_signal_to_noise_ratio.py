@@ -0,0 +1,23 @@
+from numpy import asarray, errstate
+
+
+def compute_signal_to_noise_ratio(x, y):
+
+    x = asarray(x)
+
+    y = asarray(y)
+
+    is_1 = y == y.max()
+
+    x_0 = x[..., ~is_1]
+
+    x_1 = x[..., is_1]
+
+    with errstate(divide="ignore", invalid="ignore"):
+
+        return (x_1.mean(axis=-1) - x_0.mean(axis=-1)) / (
+            x_0.std(axis=-1, ddof=1) + x_1.std(axis=-1, ddof=1)
+        )
+
+
+compute_signal_to_noise_ratio.accepts_2d_array = True
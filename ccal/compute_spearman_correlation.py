@@ -0,0 +1,11 @@
+from scipy.stats import rankdata
+
+from .compute_pearson_correlation import compute_pearson_correlation
+
+
+def compute_spearman_correlation(x, y):
+
+    return compute_pearson_correlation(rankdata(x, axis=-1), rankdata(y))
+
+
+compute_spearman_correlation.accepts_2d_array = True
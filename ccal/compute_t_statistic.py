@@ -0,0 +1,24 @@
+from numpy import asarray, errstate, sqrt
+
+
+def compute_t_statistic(x, y):
+
+    x = asarray(x)
+
+    y = asarray(y)
+
+    is_1 = y == y.max()
+
+    x_0 = x[..., ~is_1]
+
+    x_1 = x[..., is_1]
+
+    with errstate(divide="ignore", invalid="ignore"):
+
+        return (x_1.mean(axis=-1) - x_0.mean(axis=-1)) / sqrt(
+            x_0.var(axis=-1, ddof=1) / x_0.shape[-1]
+            + x_1.var(axis=-1, ddof=1) / x_1.shape[-1]
+        )
+
+
+compute_t_statistic.accepts_2d_array = True
@@ -1,10 +1,19 @@
-from random import shuffle
-
-from numpy import asarray, full, nan
-from numpy.random import choice
+from numpy import arange, array_split, asarray, concatenate, isfinite, nan
 from pandas import Series
 
+from ._get_gene_indices_and_gene_set_offsets import (
+    _get_gene_indices_and_gene_set_offsets,
+)
+from ._match_target_and_data import _match_target_and_data
+from ._permute_genes_and_compute_gsea_scores import (
+    _permute_genes_and_compute_gsea_scores,
+)
+from ._permute_phenotypes_and_compute_gsea_scores import (
+    _permute_phenotypes_and_compute_gsea_scores,
+)
 from .compute_empirical_p_value import compute_empirical_p_value
+from .GeneSetIndex import GeneSetIndex
+from .multiprocess import multiprocess
 from .single_sample_gsea import single_sample_gsea
 
 
@@ -24,16 +33,28 @@ def gsea(
     annotation_text_yshift=64,
     html_file_path=None,
     plotly_html_file_path=None,
+    random_seed=20121020,
+    n_job=1,
 ):
 
     print("Computing gene scores ...")
 
+    phenotypes = asarray(phenotypes)
+
     gene_score = Series(
-        gene_x_sample.apply(function, axis=1, args=(asarray(phenotypes),)),
+        _match_target_and_data(phenotypes, gene_x_sample.values, function, None, False),
         index=gene_x_sample.index,
     )
 
-    print("Computing gene set {} enrichment ...".format(genes.name))
+    if isinstance(genes, GeneSetIndex):
+
+        gene_set_name = ", ".join(genes.index)
+
+    else:
+
+        gene_set_name = genes.name
+
+    print("Computing gene set {} enrichment ...".format(gene_set_name))
 
     score = single_sample_gsea(
         gene_score,
@@ -55,36 +76,90 @@ def gsea(
 
     else:
 
-        permutation_scores = full(n_permutation, nan)
+        if isinstance(genes, GeneSetIndex):
 
-        permuting__gene_x_sample = gene_x_sample.copy()
+            gene_sets = genes
 
-        permuting__phenotypes = asarray(phenotypes)
+        else:
 
-        for i in range(n_permutation):
+            gene_sets = genes.to_frame().T
+
+        gene_indices, gene_set_offsets = _get_gene_indices_and_gene_set_offsets(
+            gene_sets, gene_x_sample.index
+        )
 
-            if permuting == "phenotype":
+        if permuting == "phenotype":
 
-                shuffle(permuting__phenotypes)
+            gene_x_sample_values = gene_x_sample.values
 
-            elif permuting == "gene":
+            function_kwargs = None
 
-                permuting__gene_x_sample.index = choice(
-                    permuting__gene_x_sample.index,
-                    size=permuting__gene_x_sample.shape[0],
-                    replace=False,
+            if hasattr(function, "compute_permutation_invariants"):
+
+                is_good_row = isfinite(gene_x_sample_values).all(axis=1)
+
+                if isfinite(phenotypes).all() and is_good_row.any():
+
+                    function_kwargs = function.compute_permutation_invariants(
+                        gene_x_sample_values[is_good_row], phenotypes
+                    )
+
+            if n_job == 1:
+
+                permutation_scores = _permute_phenotypes_and_compute_gsea_scores(
+                    gene_x_sample_values,
+                    phenotypes,
+                    function,
+                    function_kwargs,
+                    gene_indices,
+                    gene_set_offsets,
+                    statistic,
+                    random_seed,
+                    0,
+                    n_permutation,
+                )
+
+            else:
+
+                permutation_starts = tuple(
+                    indices[0]
+                    for indices in array_split(
+                        arange(n_permutation), min(n_permutation, n_job)
+                    )
+                ) + (n_permutation,)
+
+                permutation_scores = concatenate(
+                    multiprocess(
+                        _permute_phenotypes_and_compute_gsea_scores,
+                        (
+                            (
+                                gene_x_sample_values,
+                                phenotypes,
+                                function,
+                                function_kwargs,
+                                gene_indices,
+                                gene_set_offsets,
+                                statistic,
+                                random_seed,
+                                start,
+                                end - start,
+                            )
+                            for start, end in zip(
+                                permutation_starts[:-1], permutation_starts[1:]
+                            )
+                        ),
+                        n_job,
+                    )
                 )
 
-            permutation_scores[i] = single_sample_gsea(
-                Series(
-                    permuting__gene_x_sample.apply(
-                        function, axis=1, args=(permuting__phenotypes,)
-                    ),
-                    index=permuting__gene_x_sample.index,
-                ),
-                genes,
-                statistic=statistic,
-                plot=False,
+        elif permuting == "gene":
+
+            permutation_scores = _permute_genes_and_compute_gsea_scores(
+                gene_score.values,
+                gene_set_offsets[1],
+                statistic,
+                random_seed,
+                n_permutation,
             )
 
         p_value = min(
@@ -23,6 +23,7 @@ def hierarchical_consensus_cluster(
     linkage_method="ward",
     plot_df=True,
     directory_path=None,
+    n_landmark=None,
 ):
 
     if distance__column_x_column is None:
@@ -69,7 +70,11 @@ def hierarchical_consensus_cluster(
         )
 
     column_cluster, column_cluster__ccc = _cluster_clustering_x_element_and_compute_ccc(
-        clustering_x_column, k, linkage_method
+        clustering_x_column,
+        k,
+        linkage_method,
+        n_landmark=n_landmark,
+        random_seed=random_seed,
     )
 
     if directory_path is not None:
@@ -1,7 +1,9 @@
-from numpy import asarray
+from numpy import array_equal, asarray
 from pandas import DataFrame
 
-from .apply_function_on_2_2d_arrays_slices import apply_function_on_2_2d_arrays_slices
+from .apply_function_on_2_2d_arrays_slices_in_tiles import (
+    apply_function_on_2_2d_arrays_slices_in_tiles,
+)
 from .compute_information_coefficient import compute_information_coefficient
 from .plot_heat_map import plot_heat_map
 
@@ -16,10 +18,19 @@ def make_comparison_panel(
     name_1=None,
     file_path_prefix=None,
     plotly_html_file_path_prefix=None,
+    n_job=1,
 ):
 
-    comparison = apply_function_on_2_2d_arrays_slices(
-        asarray(_2d_array_or_df_0), asarray(_2d_array_or_df_1), match_function, axis
+    _2d_array_0 = asarray(_2d_array_or_df_0)
+
+    _2d_array_1 = asarray(_2d_array_or_df_1)
+
+    if array_equal(_2d_array_0, _2d_array_1, equal_nan=True):
+
+        _2d_array_1 = None
+
+    comparison = apply_function_on_2_2d_arrays_slices_in_tiles(
+        _2d_array_0, _2d_array_1, match_function, axis, n_job=n_job
     )
 
     if isinstance(_2d_array_or_df_0, DataFrame) and isinstance(
@@ -3,7 +3,9 @@ from ._match import _match
 from ._process_target_or_data_for_plotting import _process_target_or_data_for_plotting
 from .cluster_2d_array_slices import cluster_2d_array_slices
 from .compute_information_coefficient import compute_information_coefficient
+from .compute_pearson_correlation import compute_pearson_correlation
 from .make_object_int_mapping import make_object_int_mapping
+from .MatrixFile import MatrixFile
 from .nd_array_is_sorted import nd_array_is_sorted
 from .plot_and_save import plot_and_save
 from .select_series_indices import select_series_indices
@@ -36,6 +38,12 @@ def make_match_panel(
     annotation_font_size=10,
     file_path_prefix=None,
     plotly_html_file_path_prefix=None,
+    count_permutation_scores=False,
+    n_exceedance_to_stop=None,
+    multiprocessor=None,
+    n_screen=None,
+    screen_threshold=None,
+    screen_function=compute_pearson_correlation,
 ):
 
     if target.name is None:
@@ -64,13 +72,23 @@ def make_match_panel(
 
         target.sort_values(ascending=target_ascending, inplace=True)
 
-    data = data[target.index]
+    if isinstance(data, MatrixFile):
+
+        data = data.select_columns(data.columns.get_indexer(target.index))
+
+        values = data
+
+    else:
+
+        data = data[target.index]
+
+        values = data.values
 
     if score_moe_p_value_fdr is None:
 
         score_moe_p_value_fdr = _match(
             target.values,
-            data.values,
+            values,
             n_job,
             match_function,
             n_required_for_match_function,
@@ -80,6 +98,12 @@ def make_match_panel(
             random_seed,
             n_sampling,
             n_permutation,
+            count_permutation_scores=count_permutation_scores,
+            n_exceedance_to_stop=n_exceedance_to_stop,
+            multiprocessor=multiprocessor,
+            n_screen=n_screen,
+            screen_threshold=screen_threshold,
+            screen_function=screen_function,
         )
 
         if score_moe_p_value_fdr.isna().values.all():
@@ -102,11 +126,15 @@ def make_match_panel(
 
     scores_to_plot = score_moe_p_value_fdr.copy()
 
+    if "Promoted" in scores_to_plot.columns:
+
+        scores_to_plot = scores_to_plot.loc[scores_to_plot["Promoted"].astype(bool)]
+
     if n_extreme is not None or fraction_extreme is not None:
 
-        scores_to_plot = score_moe_p_value_fdr.loc[
+        scores_to_plot = scores_to_plot.loc[
             select_series_indices(
-                score_moe_p_value_fdr["Score"],
+                scores_to_plot["Score"],
                 "<>",
                 n=n_extreme,
                 fraction=fraction_extreme,
@@ -128,9 +156,19 @@ def make_match_panel(
 
     scores_to_plot.sort_values("Score", ascending=score_ascending, inplace=True)
 
-    data_to_plot = data.loc[scores_to_plot.index]
+    if isinstance(data, MatrixFile):
+
+        data_to_plot = data.read_df(scores_to_plot.index)
+
+    else:
+
+        data_to_plot = data.loc[scores_to_plot.index]
 
-    annotations = _make_annotations(scores_to_plot.dropna(axis=1, how="all"))
+    annotations = _make_annotations(
+        scores_to_plot.drop(
+            columns=["N Permutation", "Promoted"], errors="ignore"
+        ).dropna(axis=1, how="all")
+    )
 
     target, target_plot_min, target_plot_max, target_colorscale = _process_target_or_data_for_plotting(
         target, target_type, plot_std
@@ -147,7 +185,12 @@ def make_match_panel(
         print("Clustering heat map within category ...")
 
         clustered_indices = cluster_2d_array_slices(
-            data_to_plot.values, 1, groups=target.values, raise_for_bad=False
+            data_to_plot.values,
+            1,
+            groups=target.values,
+            raise_for_bad=False,
+            n_job=n_job,
+            multiprocessor=multiprocessor,
         )
 
         target = target.iloc[clustered_indices]
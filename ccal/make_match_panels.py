@@ -5,6 +5,7 @@ from pandas import read_csv
 from .establish_path import establish_path
 from .make_file_name_from_str import make_file_name_from_str
 from .make_match_panel import make_match_panel
+from .Multiprocessor import Multiprocessor
 
 
 def make_match_panels(
@@ -14,9 +15,25 @@ def make_match_panels(
     directory_path=None,
     plotly_directory_path=None,
     read_score_moe_p_value_fdr=False,
+    multiprocessor=None,
     **make_match_panel_kwargs,
 ):
 
+    if multiprocessor is None:
+
+        with Multiprocessor(make_match_panel_kwargs.get("n_job", 1)) as multiprocessor:
+
+            return make_match_panels(
+                target_x_sample,
+                data_dicts,
+                drop_negative_target=drop_negative_target,
+                directory_path=directory_path,
+                plotly_directory_path=plotly_directory_path,
+                read_score_moe_p_value_fdr=read_score_moe_p_value_fdr,
+                multiprocessor=multiprocessor,
+                **make_match_panel_kwargs,
+            )
+
     for target_name, target_values in target_x_sample.iterrows():
 
         if drop_negative_target:
@@ -75,5 +92,8 @@ def make_match_panels(
                 title=suffix.replace("/", "<br>"),
                 file_path_prefix=file_path_prefix,
                 plotly_html_file_path_prefix=plotly_html_file_path_prefix,
+                multiprocessor=multiprocessor,
                 **make_match_panel_kwargs,
             )
+
+    print(multiprocessor.summarize_task_times())
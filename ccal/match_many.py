@@ -0,0 +1,120 @@
+from numpy import isfinite
+from pandas import DataFrame
+
+from ._match_target_and_data_using_data_invariants import (
+    _match_target_and_data_using_data_invariants,
+)
+from .compute_information_coefficient import compute_information_coefficient
+from .establish_path import establish_path
+from .make_file_name_from_str import make_file_name_from_str
+from .make_object_int_mapping import make_object_int_mapping
+from .multiprocess import multiprocess
+
+
+def match_many(
+    target_x_sample,
+    data,
+    n_job=1,
+    match_function=compute_information_coefficient,
+    n_required_for_match_function=2,
+    raise_for_n_less_than_required=False,
+    n_extreme=8,
+    fraction_extreme=None,
+    random_seed=20_121_020,
+    n_sampling=0,
+    n_permutation=0,
+    drop_negative_target=False,
+    score_ascending=False,
+    directory_path=None,
+    data_name="Data",
+    multiprocessor=None,
+):
+
+    samples_targets = {}
+
+    for target_name, target in target_x_sample.iterrows():
+
+        if drop_negative_target:
+
+            target = target[target != -1]
+
+        target = target[target.index.intersection(data.columns)].dropna()
+
+        if target.dtype == "O":
+
+            target = target.map(make_object_int_mapping(target)[0])
+
+        samples_targets.setdefault(tuple(target.index), []).append(target)
+
+    target_score_moe_p_value_fdr = {}
+
+    for samples, targets in samples_targets.items():
+
+        print(
+            "Matching {} target with {} sample ...".format(len(targets), len(samples))
+        )
+
+        data_ = data[list(samples)].values
+
+        if hasattr(match_function, "compute_permutation_invariants"):
+
+            data_invariants = match_function.compute_permutation_invariants(
+                data_[isfinite(data_).all(axis=1)], None
+            )
+
+        else:
+
+            data_invariants = None
+
+        for target, score_moe_p_value_fdr in zip(
+            targets,
+            multiprocess(
+                _match_target_and_data_using_data_invariants,
+                (
+                    (
+                        target.values,
+                        data_,
+                        data_invariants,
+                        match_function,
+                        n_required_for_match_function,
+                        raise_for_n_less_than_required,
+                        n_extreme,
+                        fraction_extreme,
+                        random_seed,
+                        n_sampling,
+                        n_permutation,
+                    )
+                    for target in targets
+                ),
+                n_job,
+                multiprocessor=multiprocessor,
+            ),
+        ):
+
+            score_moe_p_value_fdr.index = data.index
+
+            score_moe_p_value_fdr.sort_values(
+                "Score", ascending=score_ascending, inplace=True
+            )
+
+            if directory_path is not None:
+
+                file_path = "{}/{}/{}.tsv".format(
+                    directory_path, target.name, make_file_name_from_str(data_name)
+                )
+
+                establish_path(file_path, "file")
+
+                score_moe_p_value_fdr.to_csv(file_path, sep="\t")
+
+            target_score_moe_p_value_fdr[target.name] = score_moe_p_value_fdr
+
+    target_x_feature = DataFrame(
+        [
+            target_score_moe_p_value_fdr[target_name]["Score"]
+            for target_name in target_x_sample.index
+        ],
+        index=target_x_sample.index,
+    ).reindex(columns=data.index)
+
+    return target_x_feature, target_score_moe_p_value_fdr
@@ -1,12 +1,23 @@
-from multiprocessing.pool import Pool
+from .Multiprocessor import Multiprocessor
 
-from numpy.random import seed
 
+def multiprocess(
+    callable_,
+    args,
+    n_job,
+    random_seed=20121020,
+    n_byte_to_memory_map=2 ** 20,
+    multiprocessor=None,
+):
 
-def multiprocess(callable_, args, n_job, random_seed=20121020):
+    if multiprocessor is not None:
 
-    seed(random_seed)
+        return multiprocessor.starmap(
+            callable_, args, n_byte_to_memory_map=n_byte_to_memory_map
+        )
 
-    with Pool(n_job) as process:
+    with Multiprocessor(n_job, random_seed=random_seed) as multiprocessor:
 
-        return process.starmap(callable_, args)
+        return multiprocessor.starmap(
+            callable_, args, n_byte_to_memory_map=n_byte_to_memory_map
+        )
@@ -2,11 +2,17 @@ from numpy import full, nan
 from numpy.random import random_sample, seed
 
 from ._compute_norm import _compute_norm
-from ._update_H_by_multiplicative_update import _update_H_by_multiplicative_update
-from ._update_W_by_multiplicative_update import _update_W_by_multiplicative_update
+from ._compute_norm_by_trace_identity import _compute_norm_by_trace_identity
 
 
-def nmf_by_multiplicative_update(V, k, n_iteration=int(1e3), random_seed=20121020):
+def nmf_by_multiplicative_update(
+    V,
+    k,
+    n_iteration=int(1e3),
+    random_seed=20121020,
+    tolerance=None,
+    n_iteration_per_check=10,
+):
 
     R_norms = full(n_iteration + 1, nan)
 
@@ -16,16 +22,43 @@ def nmf_by_multiplicative_update(V, k, n_iteration=int(1e3), random_seed=2012102
 
     H = random_sample(size=(k, V.shape[1]))
 
+    V_norm_squared = _compute_norm(V) ** 2
+
+    HHt = H @ H.T
+
     R_norms[0] = _compute_norm(V - W @ H)
 
-    for i in range(n_iteration):
+    stopping_reason = "n_iteration"
+
+    i = 0
+
+    while i < n_iteration:
+
+        W *= (V @ H.T) / (W @ HHt)
+
+        WtV = W.T @ V
+
+        WtW = W.T @ W
+
+        H *= WtV / (WtW @ H)
+
+        HHt = H @ H.T
+
+        R_norms[i + 1] = _compute_norm_by_trace_identity(
+            V_norm_squared, H, WtV, WtW, HHt
+        )
 
-        W = _update_W_by_multiplicative_update(V, W, H)
+        i += 1
 
-        H = _update_H_by_multiplicative_update(V, W, H)
+        if (
+            tolerance is not None
+            and i % n_iteration_per_check == 0
+            and (R_norms[i - n_iteration_per_check] - R_norms[i]) / R_norms[0]
+            < tolerance
+        ):
 
-        R_norms[i + 1] = _compute_norm(V - W @ H)
+            stopping_reason = "tolerance"
 
-        # TODO: stop based on tolerance
+            break
 
-    return W, H, R_norms
+    return W, H, R_norms[: i + 1], stopping_reason
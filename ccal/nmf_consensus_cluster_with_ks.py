@@ -1,9 +1,13 @@
-from numpy import asarray
+from math import ceil
+
+from numpy import arange, array_split, asarray
 from pandas import DataFrame, Index
 
+from ._make_nmf_consensus_clusters import _make_nmf_consensus_clusters
+from ._nmf_with_restarts import _nmf_with_restarts
+from ._plot_nmf_consensus_clusters import _plot_nmf_consensus_clusters
 from .establish_path import establish_path
 from .multiprocess import multiprocess
-from .nmf_consensus_cluster import nmf_consensus_cluster
 from .plot_heat_map import plot_heat_map
 from .plot_points import plot_points
 
@@ -20,6 +24,9 @@ def nmf_consensus_cluster_with_ks(
     plot_h=True,
     plot_df=True,
     directory_path=None,
+    solver="sklearn",
+    tolerance=1e-6,
+    n_landmark=None,
 ):
 
     if directory_path is None:
@@ -34,10 +41,56 @@ def nmf_consensus_cluster_with_ks(
 
             establish_path(k_directory_path, "directory")
 
+    n_restart_block = min(n_clustering, max(1, ceil(n_job / len(ks))))
+
+    restart_blocks = array_split(arange(n_clustering), n_restart_block)
+
+    print(
+        "NMFCC with {} K x {} restart block ({} task) ...".format(
+            len(ks), n_restart_block, len(ks) * n_restart_block
+        )
+    )
+
+    args = (
+        (df.values, k, restarts, solver, n_iteration, random_seed, tolerance)
+        for k in ks
+        for restarts in restart_blocks
+    )
+
+    if n_job == 1:
+
+        outputs = tuple(_nmf_with_restarts(*args_) for args_ in args)
+
+    else:
+
+        outputs = multiprocess(_nmf_with_restarts, args, n_job)
+
+    args = (
+        (
+            df,
+            k,
+            outputs[i * n_restart_block : (i + 1) * n_restart_block],
+            linkage_method,
+            n_landmark,
+            random_seed,
+            k_directory_path,
+        )
+        for i, (k, k_directory_path) in enumerate(zip(ks, k_directory_paths))
+    )
+
+    if n_job == 1:
+
+        k_outputs = tuple(_make_nmf_consensus_clusters(*args_) for args_ in args)
+
+    else:
+
+        k_outputs = multiprocess(_make_nmf_consensus_clusters, args, n_job)
+
     k_return = {}
 
     for (
         k,
+        k_directory_path,
         (
             w_0,
             h_0,
@@ -47,28 +100,20 @@ def nmf_consensus_cluster_with_ks(
             h_element_cluster,
             h_element_cluster__ccc,
         ),
-    ) in zip(
-        ks,
-        multiprocess(
-            nmf_consensus_cluster,
-            (
-                (
-                    df,
-                    k,
-                    n_clustering,
-                    n_iteration,
-                    random_seed,
-                    linkage_method,
-                    plot_w,
-                    plot_h,
-                    plot_df,
-                    k_directory_path,
-                )
-                for k, k_directory_path in zip(ks, k_directory_paths)
-            ),
-            n_job=n_job,
-        ),
-    ):
+    ) in zip(ks, k_directory_paths, k_outputs):
+
+        _plot_nmf_consensus_clusters(
+            df,
+            k,
+            w_0,
+            h_0,
+            w_element_cluster,
+            h_element_cluster,
+            plot_w,
+            plot_h,
+            plot_df,
+            k_directory_path,
+        )
 
         k_return["K{}".format(k)] = {
             "w": w_0,
@@ -0,0 +1,66 @@
+from os.path import isfile
+
+from numpy import load
+
+from .GeneSetIndex import GeneSetIndex
+
+
+def read_gene_set_index(gmt_file_paths, sets=None, npz_file_path=None, reset=False):
+
+    if npz_file_path is not None and isfile(npz_file_path) and not reset:
+
+        print("Reading {} ...".format(npz_file_path))
+
+        with load(npz_file_path) as npz:
+
+            gene_set_index = GeneSetIndex(
+                npz["index"], npz["genes"], npz["gene_set_offsets"], npz["gene_ids"]
+            )
+
+    else:
+
+        gene_sets = []
+
+        gene_id = {}
+
+        gene_set_offsets = [0]
+
+        gene_ids = []
+
+        for gmt_file_path in gmt_file_paths:
+
+            print("Reading {} ...".format(gmt_file_path))
+
+            with open(gmt_file_path) as gmt_file:
+
+                for line in gmt_file:
+
+                    split = line.strip().split(sep="\t")
+
+                    gene_sets.append(split[0])
+
+                    for gene in dict.fromkeys(split[2:]):
+
+                        if gene:
+
+                            gene_ids.append(gene_id.setdefault(gene, len(gene_id)))
+
+                    gene_set_offsets.append(len(gene_ids))
+
+        gene_set_index = GeneSetIndex(
+            gene_sets, tuple(gene_id), gene_set_offsets, gene_ids
+        )
+
+        if npz_file_path is not None:
+
+            print("Writing {} ...".format(npz_file_path))
+
+            gene_set_index.write(npz_file_path)
+
+    if sets is not None:
+
+        gene_set_index = gene_set_index.select(
+            gene_set_index.index[gene_set_index.index.isin(sets)]
+        )
+
+    return gene_set_index
@@ -1,8 +1,9 @@
 from warnings import warn
 
-from numpy import absolute, in1d
+from numpy import absolute, in1d, zeros
 
 from ._plot_mountain import _plot_mountain
+from .GeneSetIndex import GeneSetIndex
 
 
 def single_sample_gsea(
@@ -23,7 +24,19 @@ def single_sample_gsea(
 
     gene_score_sorted = gene_score.sort_values(ascending=False)
 
-    in_ = in1d(gene_score_sorted.index, gene_set_genes.dropna(), assume_unique=True)
+    if isinstance(gene_set_genes, GeneSetIndex):
+
+        in_ = zeros(gene_score_sorted.size, dtype=bool)
+
+        in_[
+            gene_set_genes.get_gene_indices_and_offsets(gene_score_sorted.index)[0]
+        ] = True
+
+    else:
+
+        in_ = in1d(
+            gene_score_sorted.index, gene_set_genes.dropna(), assume_unique=True
+        )
 
     in_sum = in_.sum()
 
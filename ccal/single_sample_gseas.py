@@ -1,6 +1,8 @@
+from numpy import arange, array_split
 from pandas import concat
 
 from ._single_sample_gseas import _single_sample_gseas
+from .GeneSetIndex import GeneSetIndex
 from .multiprocess import multiprocess
 from .split_df import split_df
 
@@ -9,12 +11,25 @@ def single_sample_gseas(
     gene_x_sample, gene_sets, statistic="ks", n_job=1, file_path=None
 ):
 
+    n_split = min(gene_sets.shape[0], n_job)
+
+    if isinstance(gene_sets, GeneSetIndex):
+
+        split_gene_sets = tuple(
+            gene_sets.take(indices)
+            for indices in array_split(arange(gene_sets.shape[0]), n_split)
+        )
+
+    else:
+
+        split_gene_sets = split_df(gene_sets, 0, n_split)
+
     score__gene_set_x_sample = concat(
         multiprocess(
             _single_sample_gseas,
             (
                 (gene_x_sample, gene_sets_, statistic)
-                for gene_sets_ in split_df(gene_sets, 0, min(gene_sets.shape[0], n_job))
+                for gene_sets_ in split_gene_sets
             ),
             n_job,
         )